@@ -3,16 +3,23 @@ Basic usage examples for GDELT Article Collector
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from collections import Counter
 from datetime import datetime, timedelta
 
 API_URL = "http://localhost:8004"
 
+# One keep-alive session shared by all examples (avoids a new TCP connection per call)
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 
 def example_1_simple_search():
     """Example 1: Simple keyword search"""
     print("\n=== Example 1: Simple Keyword Search ===")
     
-    response = requests.post(f"{API_URL}/search", json={
+    response = SESSION.post(f"{API_URL}/search", json={
         "keywords": ["artificial intelligence"],
         "timespan": "7d",
         "max_results": 10
@@ -31,7 +38,7 @@ def example_2_advanced_filtering():
     """Example 2: Advanced filtering with multiple criteria"""
     print("\n=== Example 2: Advanced Filtering ===")
     
-    response = requests.post(f"{API_URL}/search", json={
+    response = SESSION.post(f"{API_URL}/search", json={
         "keywords": ["climate change", "renewable energy"],
         "domains": ["bbc.com", "reuters.com", "theguardian.com"],
         "countries": ["US", "GB", "DE"],
@@ -49,7 +56,7 @@ def example_3_korean_news():
     """Example 3: Search Korean news"""
     print("\n=== Example 3: Korean News ===")
     
-    response = requests.post(f"{API_URL}/search", json={
+    response = SESSION.post(f"{API_URL}/search", json={
         "keywords": ["인공지능", "기술"],
         "countries": ["KR"],
         "languages": ["kor"],
@@ -69,7 +76,7 @@ def example_4_timeline_analysis():
     """Example 4: Timeline analysis"""
     print("\n=== Example 4: Timeline Analysis ===")
     
-    response = requests.post(f"{API_URL}/timeline", json={
+    response = SESSION.post(f"{API_URL}/timeline", json={
         "keywords": ["AI"],
         "timespan": "30d",
         "mode": "TimelineVol"
@@ -94,7 +101,7 @@ def example_5_domain_specific():
         "wired.com"
     ]
     
-    response = requests.post(f"{API_URL}/search", json={
+    response = SESSION.post(f"{API_URL}/search", json={
         "keywords": ["startup", "funding"],
         "domains": tech_domains,
         "timespan": "7d",
@@ -105,10 +112,7 @@ def example_5_domain_specific():
     print(f"Found {result['count']} startup articles")
     
     # Group by domain
-    by_domain = {}
-    for article in result['articles']:
-        domain = article.get('domain', 'unknown')
-        by_domain[domain] = by_domain.get(domain, 0) + 1
+    by_domain = Counter(article.get('domain', 'unknown') for article in result['articles'])
     
     print("\nArticles by source:")
     for domain, count in by_domain.items():
@@ -120,7 +124,7 @@ def example_6_export_to_csv():
     print("\n=== Example 6: Export to CSV ===")
     
     # First, get articles
-    search_response = requests.post(f"{API_URL}/search", json={
+    search_response = SESSION.post(f"{API_URL}/search", json={
         "keywords": ["technology"],
         "timespan": "1d",
         "max_results": 50
@@ -129,7 +133,7 @@ def example_6_export_to_csv():
     articles = search_response.json()['articles']
     
     # Export to CSV
-    export_response = requests.post(f"{API_URL}/export", json={
+    export_response = SESSION.post(f"{API_URL}/export", json={
         "articles": articles,
         "filename": "tech_news.csv"
     })
@@ -144,7 +148,7 @@ def example_7_date_range():
     print("\n=== Example 7: Specific Date Range ===")
     
     # Get articles from specific month
-    response = requests.post(f"{API_URL}/search", json={
+    response = SESSION.post(f"{API_URL}/search", json={
         "keywords": ["quantum computing"],
         "start_date": "2024-11-01",
         "end_date": "2024-11-30",
@@ -159,7 +163,7 @@ def example_8_theme_monitoring():
     """Example 8: Theme-based monitoring"""
     print("\n=== Example 8: Economic News ===")
     
-    response = requests.post(f"{API_URL}/search", json={
+    response = SESSION.post(f"{API_URL}/search", json={
         "themes": ["ECON", "ECON_BANKRUPTCY"],
         "countries": ["US"],
         "timespan": "7d",
@@ -175,13 +179,13 @@ def example_9_get_available_filters():
     print("\n=== Example 9: Available Filters ===")
     
     # Get themes
-    themes_response = requests.get(f"{API_URL}/themes")
+    themes_response = SESSION.get(f"{API_URL}/themes")
     themes = themes_response.json()
     print(f"\nAvailable themes: {len(themes['themes'])}")
     print(themes['themes'][:5], "...")
     
     # Get countries
-    countries_response = requests.get(f"{API_URL}/countries")
+    countries_response = SESSION.get(f"{API_URL}/countries")
     countries = countries_response.json()
     print(f"\nCommon countries: {countries['countries']}")
 
@@ -193,7 +197,7 @@ def main():
     
     try:
         # Check if service is running
-        health = requests.get(f"{API_URL}/health")
+        health = SESSION.get(f"{API_URL}/health")
         if health.status_code == 200:
             print("✓ Service is running")
         else:
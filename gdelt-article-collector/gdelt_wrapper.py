@@ -3,17 +3,82 @@ GDELT Article Collector Wrapper
 Provides filtering and search capabilities for GDELT database using gdeltdoc
 """
 
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
-import pandas as pd
-from gdeltdoc import GdeltDoc, Filters
+from functools import lru_cache
+import csv
+import sys
+import aiohttp
+
+if TYPE_CHECKING:
+    # gdeltdoc imports pandas in its package __init__, so it is only imported
+    # where a gdeltdoc object is actually needed
+    from gdeltdoc import GdeltDoc, Filters
+
+
+GDELT_DOC_API_URL = "https://api.gdeltproject.org/api/v2/doc/doc"
+
+# Connection pool for the async client (keeps TLS connections to GDELT warm)
+HTTP_POOL_LIMIT = 100
+HTTP_KEEPALIVE_TIMEOUT = 60
+
+# sort_by values mapped to GDELT DOC API sort orders (sorting is done server-side)
+SORT_ORDERS = {
+    "date": "DateDesc",
+    "relevance": "HybridRel"
+}
+
+# Low-cardinality article fields whose values repeat across most records
+INTERNED_FIELDS = ("domain", "language", "sourcecountry")
+
+
+@lru_cache(maxsize=512)
+def _build_filters(filter_items: Tuple[Tuple[str, Any], ...], sort: Optional[str] = None) -> "Filters":
+    """Build a Filters object from hashable filter items (cached per filter set)"""
+    from gdeltdoc import Filters
+
+    filters = Filters(**{
+        key: list(value) if isinstance(value, tuple) else value
+        for key, value in filter_items
+    })
+    if sort:
+        # Filters has no sort option; GDELT reads it as a separate query parameter
+        filters.query_params.append(f"&sort={sort}")
+    return filters
+
+
+def _get_filters(filter_kwargs: Dict[str, Any], sort: Optional[str] = None) -> "Filters":
+    """
+    Get a Filters object for the given kwargs
+
+    Filters validates its arguments and assembles the GDELT query string on
+    construction, so identical filter sets reuse one cached (read-only) instance.
+    """
+    filter_items = tuple(sorted(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in filter_kwargs.items()
+    ))
+    return _build_filters(filter_items, sort)
+
+
+def _intern_fields(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Intern repeated field values so equal strings share one object"""
+    for article in articles:
+        for field in INTERNED_FIELDS:
+            value = article.get(field)
+            if type(value) is str:
+                article[field] = sys.intern(value)
+    return articles
 
 
 class GDELTCollector:
     """Wrapper for GDELT article collection with advanced filtering"""
     
-    def __init__(self):
-        self.gd = GdeltDoc()
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        # gdeltdoc client for the sync paths (created lazily on first use)
+        self._gd: Optional["GdeltDoc"] = None
+        # Shared HTTP session for the async API (created lazily if not given)
+        self.session = session
         
     def search_articles(
         self,
@@ -46,40 +111,15 @@ class GDELTCollector:
         Returns:
             Dict with articles (DataFrame), metadata, and stats
         """
-        # Build filter object with keyword parameter
-        filter_kwargs = {}
-
-        # Handle keywords - join multiple keywords
-        if keywords:
-            keyword_query = " OR ".join(keywords)
-            filter_kwargs['keyword'] = keyword_query
-
-        # Handle timespan using the API's built-in timespan parameter
-        if timespan:
-            filter_kwargs['timespan'] = timespan
-        else:
-            # Use date range if no timespan
-            if start_date:
-                filter_kwargs['start_date'] = start_date
-            if end_date:
-                filter_kwargs['end_date'] = end_date
-
-        # Add other filters
-        if domains:
-            filter_kwargs['domain'] = domains
-        if countries:
-            filter_kwargs['country'] = countries
-        if themes:
-            filter_kwargs['theme'] = themes
-        if languages:
-            filter_kwargs['language'] = languages
-
-        # Create Filters object with parameters
-        f = Filters(**filter_kwargs)
+        # Get (cached) Filters object for these parameters
+        f = _get_filters(self._search_filter_kwargs(
+            keywords, domains, start_date, end_date,
+            countries, themes, languages, timespan
+        ), sort=SORT_ORDERS.get(sort_by))
 
         # Execute search
         try:
-            articles_df = self.gd.article_search(f)
+            articles_df = self._get_gd().article_search(f)
 
             if articles_df.empty:
                 return {
@@ -90,16 +130,12 @@ class GDELTCollector:
                     "message": "No articles found with given filters"
                 }
 
-            # Sort results
-            if sort_by == "date" and "seendate" in articles_df.columns:
-                articles_df = articles_df.sort_values("seendate", ascending=False)
-
             # Limit results
             if max_results and len(articles_df) > max_results:
                 articles_df = articles_df.head(max_results)
 
             # Convert to list of dicts
-            articles = articles_df.to_dict("records")
+            articles = _intern_fields(articles_df.to_dict("records"))
 
             return {
                 "success": True,
@@ -118,6 +154,67 @@ class GDELTCollector:
                 "filters": self._get_filter_summary(f, timespan)
             }
     
+    async def asearch_articles(
+        self,
+        keywords: Optional[List[str]] = None,
+        domains: Optional[List[str]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        countries: Optional[List[str]] = None,
+        themes: Optional[List[str]] = None,
+        languages: Optional[List[str]] = None,
+        max_results: int = 250,
+        timespan: Optional[str] = None,
+        sort_by: str = "date"
+    ) -> Dict[str, Any]:
+        """
+        Async version of search_articles
+
+        Queries the GDELT DOC API over the collector's pooled aiohttp session,
+        so warm requests reuse an open connection instead of a new TLS handshake.
+        Takes the same arguments and returns the same dict as search_articles.
+        """
+        f = _get_filters(self._search_filter_kwargs(
+            keywords, domains, start_date, end_date,
+            countries, themes, languages, timespan
+        ), sort=SORT_ORDERS.get(sort_by))
+
+        try:
+            response = await self._aquery("artlist", f)
+            articles = response.get("articles", [])
+
+            if not articles:
+                return {
+                    "success": True,
+                    "articles": [],
+                    "count": 0,
+                    "filters": self._get_filter_summary(f, timespan),
+                    "message": "No articles found with given filters"
+                }
+
+            # Limit results
+            if max_results and len(articles) > max_results:
+                articles = articles[:max_results]
+
+            _intern_fields(articles)
+
+            return {
+                "success": True,
+                "articles": articles,
+                "count": len(articles),
+                "filters": self._get_filter_summary(f, timespan),
+                "columns": list(dict.fromkeys(key for article in articles for key in article))
+            }
+
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "articles": [],
+                "count": 0,
+                "filters": self._get_filter_summary(f, timespan)
+            }
+
     def get_timeline(
         self,
         keywords: Optional[List[str]] = None,
@@ -158,11 +255,11 @@ class GDELTCollector:
         if domains:
             filter_kwargs['domain'] = domains
 
-        # Create Filters object with parameters
-        f = Filters(**filter_kwargs)
+        # Get (cached) Filters object for these parameters
+        f = _get_filters(filter_kwargs)
 
         try:
-            timeline_df = self.gd.timeline_search(mode, f)
+            timeline_df = self._get_gd().timeline_search(mode, f)
 
             if timeline_df.empty:
                 return {
@@ -193,8 +290,12 @@ class GDELTCollector:
     def export_to_csv(self, articles: List[Dict], filepath: str) -> Dict[str, Any]:
         """Export articles to CSV file"""
         try:
-            df = pd.DataFrame(articles)
-            df.to_csv(filepath, index=False)
+            # Columns in first-seen order across all articles (same as a DataFrame)
+            fieldnames = list(dict.fromkeys(key for article in articles for key in article))
+            with open(filepath, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames, restval="")
+                writer.writeheader()
+                writer.writerows(articles)
             return {
                 "success": True,
                 "filepath": filepath,
@@ -206,7 +307,93 @@ class GDELTCollector:
                 "error": str(e)
             }
     
-    def _get_filter_summary(self, filters: Filters, timespan: Optional[str] = None) -> Dict[str, Any]:
+    def _get_gd(self) -> "GdeltDoc":
+        """Get the gdeltdoc client, creating it on first use"""
+        if self._gd is None:
+            from gdeltdoc import GdeltDoc
+
+            self._gd = GdeltDoc()
+        return self._gd
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating a pooled one on first use"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=HTTP_POOL_LIMIT,
+                    keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+                )
+            )
+        return self.session
+
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    async def _aquery(self, mode: str, filters: "Filters") -> Dict[str, Any]:
+        """Run a GDELT DOC API query over the shared session"""
+        url = f"{GDELT_DOC_API_URL}?query={filters.query_string}&mode={mode}&format=json"
+
+        async with self._get_session().get(url) as response:
+            body = await response.read()
+
+            if response.status not in (200, 202):
+                raise ValueError(
+                    f"GDELT API returned status {response.status}: {body.decode(errors='replace')}"
+                )
+            # GDELT answers invalid queries with a text/html error message
+            if "text/html" in response.headers.get("Content-Type", ""):
+                raise ValueError(
+                    f"The query was not valid. The API error message was: {body.decode(errors='replace').strip()}"
+                )
+
+        from gdeltdoc.helpers import load_json
+
+        return load_json(body)
+
+    @staticmethod
+    def _search_filter_kwargs(
+        keywords: Optional[List[str]],
+        domains: Optional[List[str]],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        countries: Optional[List[str]],
+        themes: Optional[List[str]],
+        languages: Optional[List[str]],
+        timespan: Optional[str]
+    ) -> Dict[str, Any]:
+        """Build Filters kwargs for an article search"""
+        filter_kwargs = {}
+
+        # Handle keywords - join multiple keywords
+        if keywords:
+            keyword_query = " OR ".join(keywords)
+            filter_kwargs['keyword'] = keyword_query
+
+        # Handle timespan using the API's built-in timespan parameter
+        if timespan:
+            filter_kwargs['timespan'] = timespan
+        else:
+            # Use date range if no timespan
+            if start_date:
+                filter_kwargs['start_date'] = start_date
+            if end_date:
+                filter_kwargs['end_date'] = end_date
+
+        # Add other filters
+        if domains:
+            filter_kwargs['domain'] = domains
+        if countries:
+            filter_kwargs['country'] = countries
+        if themes:
+            filter_kwargs['theme'] = themes
+        if languages:
+            filter_kwargs['language'] = languages
+
+        return filter_kwargs
+
+    def _get_filter_summary(self, filters: "Filters", timespan: Optional[str] = None) -> Dict[str, Any]:
         """Get summary of applied filters"""
         summary = {}
         
@@ -3,24 +3,71 @@ FastAPI Service for GDELT Article Collection
 Provides REST API endpoints for searching and exporting GDELT articles
 """
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.responses import FileResponse
+from fastapi.routing import APIRoute
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, List, Optional
+from contextlib import asynccontextmanager
+import aiohttp
+import orjson
 import uvicorn
 import os
 from datetime import datetime
 
-from gdelt_wrapper import GDELTCollector
+from gdelt_wrapper import GDELTCollector, HTTP_POOL_LIMIT, HTTP_KEEPALIVE_TIMEOUT
+
+
+collector = GDELTCollector()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup: one pooled HTTP session shared by all GDELT requests
+    app.state.http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=HTTP_POOL_LIMIT,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+        )
+    )
+    collector.session = app.state.http_session
+    yield
+    # Shutdown: close pooled connections
+    await collector.aclose()
 
 
 app = FastAPI(
     title="GDELT Article Collector API",
     description="Search and collect news articles from GDELT database with advanced filtering",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-collector = GDELTCollector()
+
+class ORJSONRequest(Request):
+    """Request that decodes its JSON body with orjson instead of the stdlib parser"""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Route class that hands endpoints an ORJSONRequest (large /export payloads)"""
+
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+
+        async def custom_route_handler(request: Request) -> Response:
+            request = ORJSONRequest(request.scope, request.receive)
+            return await original_route_handler(request)
+
+        return custom_route_handler
+
+
+# Must be set before any endpoint is registered
+app.router.route_class = ORJSONRoute
 
 
 # Request Models
@@ -82,6 +129,25 @@ class TimelineResponse(BaseModel):
     error: Optional[str] = None
 
 
+# SearchResponse fields in schema order (articles are encoded as-is)
+SEARCH_RESPONSE_FIELDS = tuple(SearchResponse.model_fields)
+
+
+def encode_search_response(result: Dict[str, Any]) -> Response:
+    """
+    Encode a search result directly into a JSON response
+
+    The collector already returns the SearchResponse shape, so this skips
+    FastAPI's generic per-article validation/serialization pass and writes
+    the body with a single orjson call.
+    """
+    body = {field: result.get(field) for field in SEARCH_RESPONSE_FIELDS}
+    return Response(
+        content=orjson.dumps(body, default=str),
+        media_type="application/json"
+    )
+
+
 # Endpoints
 @app.get("/")
 async def root():
@@ -116,7 +182,7 @@ async def search_articles(request: SearchRequest):
     }
     ```
     """
-    result = collector.search_articles(
+    result = await collector.asearch_articles(
         keywords=request.keywords,
         domains=request.domains,
         start_date=request.start_date,
@@ -129,7 +195,8 @@ async def search_articles(request: SearchRequest):
         sort_by=request.sort_by
     )
     
-    return result
+    # response_model stays on the route for the OpenAPI docs
+    return encode_search_response(result)
 
 
 @app.post("/timeline", response_model=TimelineResponse)
@@ -3,8 +3,9 @@ MCP Server for GDELT Article Collector
 Exposes GDELT search as MCP tool for AI agent integration
 """
 
-import json
 import asyncio
+import functools
+import orjson
 from typing import Any, Dict, List, Optional
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
@@ -22,128 +23,151 @@ collector = GDELTCollector()
 mcp_server = Server("gdelt-article-collector")
 
 
-@mcp_server.list_tools()
-async def handle_list_tools() -> List[Tool]:
-    """List available GDELT tools"""
-    return [
-        Tool(
-            name="gdelt_search_articles",
-            description=(
-                "Search GDELT database for news articles with advanced filtering. "
-                "GDELT monitors news from around the world in real-time. "
-                "Supports filtering by keywords, domains, countries, themes, dates, and languages."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "keywords": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Keywords to search for (e.g., ['AI', 'machine learning'])"
-                    },
-                    "domains": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Domain filters (e.g., ['bbc.com', 'cnn.com'])"
-                    },
-                    "start_date": {
-                        "type": "string",
-                        "description": "Start date in YYYY-MM-DD format"
-                    },
-                    "end_date": {
-                        "type": "string",
-                        "description": "End date in YYYY-MM-DD format"
-                    },
-                    "countries": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Country codes (e.g., ['US', 'GB', 'KR'])"
-                    },
-                    "themes": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "GDELT themes (e.g., ['ECON', 'ENV_CLIMATECHANGE'])"
-                    },
-                    "languages": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Language codes (e.g., ['eng', 'kor'])"
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of results (1-1000)",
-                        "default": 50
-                    },
-                    "timespan": {
-                        "type": "string",
-                        "enum": ["1d", "7d", "30d"],
-                        "description": "Quick timespan option (overrides dates)"
-                    }
-                },
-                "required": []
-            }
+def _dumps(obj: Any) -> str:
+    """Pretty-print JSON for agent output (orjson; timestamps etc. via str)"""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+
+
+@functools.cache
+def _themes_text() -> str:
+    """Formatted theme list (static, built once)"""
+    themes = collector.get_available_themes()
+    return "Available GDELT Themes:\n\n" + "\n".join(f"- {theme}" for theme in themes)
+
+
+@functools.cache
+def _countries_text() -> str:
+    """Formatted country code list (static, built once)"""
+    countries = collector.get_available_countries()
+    return "Common Country Codes:\n\n" + "\n".join(f"- {code}" for code in countries)
+
+
+# Tool definitions are static: build them once at import
+_TOOLS = [
+    Tool(
+        name="gdelt_search_articles",
+        description=(
+            "Search GDELT database for news articles with advanced filtering. "
+            "GDELT monitors news from around the world in real-time. "
+            "Supports filtering by keywords, domains, countries, themes, dates, and languages."
         ),
-        Tool(
-            name="gdelt_get_timeline",
-            description=(
-                "Get timeline view of article volume over time for specific topics. "
-                "Useful for analyzing trends and understanding when stories broke."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "keywords": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Keywords to track over time"
-                    },
-                    "domains": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Domain filters"
-                    },
-                    "start_date": {
-                        "type": "string",
-                        "description": "Start date in YYYY-MM-DD format"
-                    },
-                    "end_date": {
-                        "type": "string",
-                        "description": "End date in YYYY-MM-DD format"
-                    },
-                    "timespan": {
-                        "type": "string",
-                        "enum": ["1d", "7d", "30d"],
-                        "description": "Quick timespan option"
-                    },
-                    "mode": {
-                        "type": "string",
-                        "enum": ["ArtList", "TimelineVol"],
-                        "description": "Timeline mode",
-                        "default": "TimelineVol"
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "keywords": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Keywords to search for (e.g., ['AI', 'machine learning'])"
                 },
-                "required": []
-            }
-        ),
-        Tool(
-            name="gdelt_get_themes",
-            description="Get list of available GDELT themes for filtering",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
+                "domains": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Domain filters (e.g., ['bbc.com', 'cnn.com'])"
+                },
+                "start_date": {
+                    "type": "string",
+                    "description": "Start date in YYYY-MM-DD format"
+                },
+                "end_date": {
+                    "type": "string",
+                    "description": "End date in YYYY-MM-DD format"
+                },
+                "countries": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Country codes (e.g., ['US', 'GB', 'KR'])"
+                },
+                "themes": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "GDELT themes (e.g., ['ECON', 'ENV_CLIMATECHANGE'])"
+                },
+                "languages": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Language codes (e.g., ['eng', 'kor'])"
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of results (1-1000)",
+                    "default": 50
+                },
+                "timespan": {
+                    "type": "string",
+                    "enum": ["1d", "7d", "30d"],
+                    "description": "Quick timespan option (overrides dates)"
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="gdelt_get_timeline",
+        description=(
+            "Get timeline view of article volume over time for specific topics. "
+            "Useful for analyzing trends and understanding when stories broke."
         ),
-        Tool(
-            name="gdelt_get_countries",
-            description="Get list of common country codes for filtering",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        )
-    ]
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "keywords": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Keywords to track over time"
+                },
+                "domains": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Domain filters"
+                },
+                "start_date": {
+                    "type": "string",
+                    "description": "Start date in YYYY-MM-DD format"
+                },
+                "end_date": {
+                    "type": "string",
+                    "description": "End date in YYYY-MM-DD format"
+                },
+                "timespan": {
+                    "type": "string",
+                    "enum": ["1d", "7d", "30d"],
+                    "description": "Quick timespan option"
+                },
+                "mode": {
+                    "type": "string",
+                    "enum": ["ArtList", "TimelineVol"],
+                    "description": "Timeline mode",
+                    "default": "TimelineVol"
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="gdelt_get_themes",
+        description="Get list of available GDELT themes for filtering",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="gdelt_get_countries",
+        description="Get list of common country codes for filtering",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    )
+]
+
+
+@mcp_server.list_tools()
+async def handle_list_tools() -> List[Tool]:
+    """List available GDELT tools"""
+    return _TOOLS
 
 
 @mcp_server.call_tool()
@@ -154,7 +178,9 @@ async def handle_call_tool(
     """Handle tool execution"""
     
     if name == "gdelt_search_articles":
-        result = collector.search_articles(
+        # Async request over the collector's pooled aiohttp session, so
+        # parallel tool calls run concurrently and reuse connections
+        result = await collector.asearch_articles(
             keywords=arguments.get("keywords"),
             domains=arguments.get("domains"),
             start_date=arguments.get("start_date"),
@@ -172,19 +198,21 @@ async def handle_call_tool(
             # Truncate articles for token efficiency
             articles = result["articles"][:10]  # Show first 10
             
-            summary = f"""Found {result['count']} articles
+            header = f"""Found {result['count']} articles
             
-Filters applied: {json.dumps(result['filters'], indent=2)}
+Filters applied: {_dumps(result['filters'])}
 
 Top {len(articles)} results:
 """
-            for i, article in enumerate(articles, 1):
-                summary += f"\n{i}. {article.get('title', 'No title')}"
-                summary += f"\n   Source: {article.get('domain', 'Unknown')}"
-                summary += f"\n   URL: {article.get('url', 'No URL')}"
-                if 'seendate' in article:
-                    summary += f"\n   Date: {article['seendate']}"
-                summary += "\n"
+            lines = [
+                f"\n{i}. {article.get('title', 'No title')}"
+                f"\n   Source: {article.get('domain', 'Unknown')}"
+                f"\n   URL: {article.get('url', 'No URL')}"
+                + (f"\n   Date: {article['seendate']}" if 'seendate' in article else "")
+                + "\n"
+                for i, article in enumerate(articles, 1)
+            ]
+            summary = header + "".join(lines)
             
             return [TextContent(
                 type="text",
@@ -197,7 +225,9 @@ Top {len(articles)} results:
             )]
     
     elif name == "gdelt_get_timeline":
-        result = collector.get_timeline(
+        # Timeline still goes through gdeltdoc (blocking): run it in a thread
+        result = await asyncio.to_thread(
+            collector.get_timeline,
             keywords=arguments.get("keywords"),
             domains=arguments.get("domains"),
             start_date=arguments.get("start_date"),
@@ -209,11 +239,11 @@ Top {len(articles)} results:
         if result["success"]:
             timeline_text = f"""Timeline Analysis ({result['mode']})
 
-Filters: {json.dumps(result['filters'], indent=2)}
+Filters: {_dumps(result['filters'])}
 
 Data points: {result['count']}
 
-{json.dumps(result['timeline'][:20], indent=2)}
+{_dumps(result['timeline'][:20])}
 """
             return [TextContent(
                 type="text",
@@ -226,17 +256,15 @@ Data points: {result['count']}
             )]
     
     elif name == "gdelt_get_themes":
-        themes = collector.get_available_themes()
         return [TextContent(
             type="text",
-            text=f"Available GDELT Themes:\n\n" + "\n".join(f"- {theme}" for theme in themes)
+            text=_themes_text()
         )]
     
     elif name == "gdelt_get_countries":
-        countries = collector.get_available_countries()
         return [TextContent(
             type="text",
-            text=f"Common Country Codes:\n\n" + "\n".join(f"- {code}" for code in countries)
+            text=_countries_text()
         )]
     
     else:
@@ -245,19 +273,23 @@ Data points: {result['count']}
 
 async def main():
     """Run MCP server"""
-    async with stdio_server() as (read_stream, write_stream):
-        await mcp_server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="gdelt-article-collector",
-                server_version="1.0.0",
-                capabilities=mcp_server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={}
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await mcp_server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="gdelt-article-collector",
+                    server_version="1.0.0",
+                    capabilities=mcp_server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={}
+                    )
                 )
             )
-        )
+    finally:
+        # Close the pooled HTTP session opened by the first search
+        await collector.aclose()
 
 
 if __name__ == "__main__":
@@ -4,10 +4,11 @@ Basic Usage Example - Large Text Summarizer
 Demonstrates simple text summarization with LOCAL LLM.
 """
 
+import asyncio
 import sys
 sys.path.append('..')
 
-from summarizer import summarize_large_text
+from summarizer import asummarize_large_text, OLLAMA_CLIENT_KWARGS
 from langchain_ollama import ChatOllama
 import os
 from dotenv import load_dotenv
@@ -17,7 +18,8 @@ load_dotenv()
 # Initialize LOCAL LLM
 llm = ChatOllama(
     model=os.getenv("LLM_MODEL", "qwen2.5:7b"),
-    base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+    base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
+    client_kwargs=OLLAMA_CLIENT_KWARGS  # Keep-alive pool across chunk calls
 )
 
 # Example: Long article about AI
@@ -46,14 +48,15 @@ print("LARGE TEXT SUMMARIZER - Basic Example")
 print("=" * 60)
 print()
 
-# Summarize
-result = summarize_large_text(
+# Summarize (chunks are summarized concurrently)
+result = asyncio.run(asummarize_large_text(
     text=long_text,
     llm=llm,
     max_final_tokens=300,  # Target 300-token summary
     context_limit=4000,     # Assume 4K context window
-    show_progress=True
-)
+    show_progress=True,
+    max_concurrency=4       # Chunk summaries in flight at once
+))
 
 print("\n" + "=" * 60)
 print("FINAL SUMMARY")
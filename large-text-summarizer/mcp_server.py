@@ -5,24 +5,59 @@ Exposes summarization functionality as an MCP tool that can be used by AI agents
 """
 
 import os
-from typing import Any
+import hashlib
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 from langchain_ollama import ChatOllama
 from dotenv import load_dotenv
-from summarizer import summarize_large_text, summarize_file
+from summarizer import asummarize_large_text, asummarize_file, OLLAMA_CLIENT_KWARGS, ProgressCallback
 
 load_dotenv()
 
 # Initialize server
 app = Server("large-text-summarizer")
 
-# Initialize LLM
+# Initialize LLM (one instance, so all tool calls share its connection pool)
 llm = ChatOllama(
     model=os.getenv("LLM_MODEL", "qwen2.5:7b"),
-    base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+    base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
+    client_kwargs=OLLAMA_CLIENT_KWARGS
 )
 
+# LRU cache of recent results so repeated requests skip the LLM entirely
+# (text keyed by content hash, files by path + mtime + size)
+CACHE_SIZE = int(os.getenv("SUMMARY_CACHE_SIZE", 64))
+_cache: "OrderedDict[Hashable, dict]" = OrderedDict()
+
+
+def _cache_get(key: Hashable) -> Optional[dict]:
+    result = _cache.get(key)
+    if result is not None:
+        _cache.move_to_end(key)
+    return result
+
+
+def _cache_put(key: Hashable, result: dict) -> None:
+    _cache[key] = result
+    _cache.move_to_end(key)
+    while len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+
+
+def _progress_callback() -> Optional[ProgressCallback]:
+    """Relay summarizer progress as MCP progress notifications (if the client asked)."""
+    ctx = app.request_context
+    token = ctx.meta.progressToken if ctx.meta is not None else None
+    if token is None:
+        return None
+    
+    async def send(progress: float, total: float) -> None:
+        await ctx.session.send_progress_notification(token, progress, total)
+    
+    return send
+
 
 @app.list_tools()
 async def list_tools() -> list[Tool]:
@@ -94,14 +129,24 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
         max_tokens = arguments.get("max_tokens", 500)
         context_limit = arguments.get("context_limit", 4000)
         
-        # Run summarization
-        result = summarize_large_text(
-            text=text,
-            llm=llm,
-            max_final_tokens=max_tokens,
-            context_limit=context_limit,
-            show_progress=False  # Disable progress in MCP mode
+        key = (
+            "text",
+            hashlib.blake2b(text.encode(), digest_size=16).digest(),
+            max_tokens,
+            context_limit
         )
+        result = _cache_get(key)
+        if result is None:
+            # Run summarization
+            result = await asummarize_large_text(
+                text=text,
+                llm=llm,
+                max_final_tokens=max_tokens,
+                context_limit=context_limit,
+                show_progress=False,  # stdout is the MCP transport
+                on_progress=_progress_callback()
+            )
+            _cache_put(key, result)
         
         # Format response
         stats = result['stats']
@@ -128,12 +173,20 @@ Statistics:
                 text=f"Error: File not found: {file_path}"
             )]
         
-        # Run summarization
-        result = summarize_file(
-            file_path=file_path,
-            llm=llm,
-            max_final_tokens=max_tokens
-        )
+        # A modified file gets a new mtime/size and therefore a new key
+        stat = os.stat(file_path)
+        key = ("file", os.path.realpath(file_path), stat.st_mtime_ns, stat.st_size, max_tokens)
+        result = _cache_get(key)
+        if result is None:
+            # Run summarization
+            result = await asummarize_file(
+                file_path=file_path,
+                llm=llm,
+                max_final_tokens=max_tokens,
+                show_progress=False,  # stdout is the MCP transport
+                on_progress=_progress_callback()
+            )
+            _cache_put(key, result)
         
         # Format response
         stats = result['stats']
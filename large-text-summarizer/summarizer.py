@@ -3,18 +3,84 @@ Large Text Summarizer - Map-Reduce approach with smart chunking
 
 Summarizes text larger than LLM context window using a two-stage process:
 1. Split text → summarize each chunk
-2. Combine chunk summaries → final summary
+2. Combine chunk summaries → final summary (merged in rounds if they exceed the context)
 
 Works with 100% LOCAL LLMs (Ollama, vLLM, LiteLLM)
 """
 
-from typing import List, Optional
+import asyncio
+import math
+import os
+from typing import Awaitable, Callable, List, Optional
+import httpx
 import tiktoken
 from langchain_ollama import ChatOllama
 from langchain_core.messages import HumanMessage
 
 
-def count_tokens(text: str, encoding_name: str = "cl100k_base") -> int:
+# Default number of chunk summaries requested from the LLM at once
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Async progress hook: called with (completed LLM calls, total calls so far)
+ProgressCallback = Callable[[float, float], Awaitable[None]]
+
+# Block size (bytes of whole lines) for streaming file tokenization
+FILE_READ_SIZE = 1 << 20
+
+# Texts longer than this (chars) are tokenized in parallel shards
+PARALLEL_ENCODE_MIN_CHARS = 1 << 22
+
+# Pass as ChatOllama(client_kwargs=...) so connections to Ollama stay open
+# between chunk calls (httpx otherwise drops idle connections after 5s)
+OLLAMA_CLIENT_KWARGS = {
+    "limits": httpx.Limits(max_keepalive_connections=16, keepalive_expiry=60)
+}
+
+DIRECT_PROMPT = """Summarize the following text concisely in approximately {max_tokens} tokens:
+
+{text}"""
+
+CHUNK_PROMPT = """Summarize the following text section concisely, preserving key information:
+
+{text}
+
+Summary:"""
+
+FINAL_PROMPT = """Create a comprehensive summary of the following section summaries in approximately {max_tokens} tokens.
+Focus on main themes, key points, and important conclusions:
+
+{text}
+
+Final Summary:"""
+
+REDUCE_PROMPT = """Combine the following section summaries into one concise summary, preserving key information:
+
+{text}
+
+Summary:"""
+
+# Tokens reserved for the prompt template around each chunk / the summaries
+PROMPT_MARGIN = 500
+
+# Token overlap between consecutive chunks, and the smallest chunk size used
+CHUNK_OVERLAP = 100
+MIN_CHUNK_TOKENS = 500
+
+
+ENCODING_NAME = "cl100k_base"
+
+_encoding: Optional[tiktoken.Encoding] = None
+
+
+def _get_encoding() -> tiktoken.Encoding:
+    """Get the shared cl100k_base encoding (loaded once per process)."""
+    global _encoding
+    if _encoding is None:
+        _encoding = tiktoken.get_encoding(ENCODING_NAME)
+    return _encoding
+
+
+def count_tokens(text: str, encoding_name: str = ENCODING_NAME) -> int:
     """
     Count tokens in text using tiktoken.
     
@@ -25,56 +91,94 @@ def count_tokens(text: str, encoding_name: str = "cl100k_base") -> int:
     Returns:
         Number of tokens
     """
-    encoding = tiktoken.get_encoding(encoding_name)
-    return len(encoding.encode(text))
+    if encoding_name == ENCODING_NAME:
+        encoding = _get_encoding()
+    else:
+        encoding = tiktoken.get_encoding(encoding_name)
+    return len(encoding.encode_ordinary(text))
 
 
 def calculate_optimal_chunks(
     total_tokens: int,
     context_limit: int = 4000,
-    target_combined_tokens: int = 6000,
-    summary_compression_ratio: float = 0.15
+    overlap: int = CHUNK_OVERLAP,
+    prompt_margin: int = PROMPT_MARGIN
 ) -> tuple[int, int]:
     """
-    Calculate optimal chunk size to ensure combined summaries fit in final call.
+    Calculate the fewest, evenly sized chunks that each fit one LLM call.
     
     Args:
         total_tokens: Total tokens in original text
         context_limit: LLM context window size
-        target_combined_tokens: Target total tokens for combined summaries
-        summary_compression_ratio: Expected compression ratio (summary/original)
+        overlap: Overlap tokens between consecutive chunks
+        prompt_margin: Tokens reserved for the prompt template
     
     Returns:
         (num_chunks, tokens_per_chunk)
     
     Example:
-        100K tokens → 80 chunks of 1250 tokens
-        → 80 summaries × 100 tokens = 8K tokens
-        → Fits in 8K context for final summary
+        100K tokens, 4K context → 30 chunks of 3,430 tokens
+        (if the combined summaries don't fit the final call they are
+        tree-reduced, see REDUCE_PROMPT)
     """
-    # Estimate tokens in combined summaries
-    expected_summary_tokens = total_tokens * summary_compression_ratio
+    if total_tokens <= 0:
+        return 1, 0
     
-    # If already small enough, use minimal chunks
-    if expected_summary_tokens <= target_combined_tokens:
-        num_chunks = max(1, total_tokens // context_limit)
-        tokens_per_chunk = total_tokens // num_chunks if num_chunks > 0 else total_tokens
-        return num_chunks, tokens_per_chunk
+    # Largest chunk that fits alongside the prompt (never below MIN_CHUNK_TOKENS)
+    max_chunk = max(context_limit - prompt_margin, MIN_CHUNK_TOKENS, overlap + 1)
     
-    # Calculate chunks needed to fit combined summaries in target
-    num_chunks = int((expected_summary_tokens / target_combined_tokens) * 
-                     (total_tokens / context_limit)) + 1
+    # Each chunk after the first adds (chunk - overlap) new tokens
+    remaining = max(total_tokens - overlap, 1)
+    num_chunks = math.ceil(remaining / (max_chunk - overlap))
     
-    # Ensure chunks aren't too small (minimum 500 tokens)
-    num_chunks = min(num_chunks, total_tokens // 500)
-    num_chunks = max(1, num_chunks)
+    # Spread tokens evenly instead of leaving a small tail chunk
+    tokens_per_chunk = math.ceil(remaining / num_chunks) + overlap
     
-    tokens_per_chunk = total_tokens // num_chunks
+    return num_chunks, min(tokens_per_chunk, max_chunk)
+
+
+def _split_on_lines(text: str, num_shards: int) -> List[str]:
+    """
+    Split text into ~num_shards pieces at line starts.
+    
+    Cuts only after a newline that is followed by a non-space character,
+    which is a boundary tiktoken's pre-tokenizer never merges across, so
+    encoding the shards separately gives the same tokens as the whole text.
+    """
+    shard_size = len(text) // num_shards
+    bounds = [0]
+    for k in range(1, num_shards):
+        cut = text.find("\n", max(bounds[-1], k * shard_size))
+        while cut != -1 and cut + 1 < len(text) and text[cut + 1].isspace():
+            cut = text.find("\n", cut + 1)
+        if cut == -1 or cut + 1 >= len(text):
+            break
+        bounds.append(cut + 1)
+    bounds.append(len(text))
+    return [text[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+def _encode_text(text: str) -> List[int]:
+    """
+    Encode text to tokens, sharding very large inputs across CPU threads.
     
-    return num_chunks, tokens_per_chunk
+    tiktoken releases the GIL in its native core, so encode_ordinary_batch
+    runs the shards in parallel on its internal thread pool.
+    """
+    encoding = _get_encoding()
+    num_threads = os.cpu_count() or 1
+    if len(text) < PARALLEL_ENCODE_MIN_CHARS or num_threads == 1:
+        return encoding.encode_ordinary(text)
+    
+    tokens: List[int] = []
+    for shard_tokens in encoding.encode_ordinary_batch(
+        _split_on_lines(text, num_threads), num_threads=num_threads
+    ):
+        tokens.extend(shard_tokens)
+    return tokens
 
 
-def chunk_text_by_tokens(text: str, chunk_size: int, overlap: int = 100) -> List[str]:
+def chunk_text_by_tokens(text: str, chunk_size: int, overlap: int = CHUNK_OVERLAP) -> List[str]:
     """
     Split text into chunks by token count with overlap.
     
@@ -86,24 +190,92 @@ def chunk_text_by_tokens(text: str, chunk_size: int, overlap: int = 100) -> List
     Returns:
         List of text chunks
     """
-    encoding = tiktoken.get_encoding("cl100k_base")
-    tokens = encoding.encode(text)
-    
-    chunks = []
-    start = 0
-    
-    while start < len(tokens):
-        end = start + chunk_size
-        chunk_tokens = tokens[start:end]
-        chunk_text = encoding.decode(chunk_tokens)
-        chunks.append(chunk_text)
-        
-        # Move start with overlap
-        start = end - overlap
-        if start >= len(tokens):
-            break
+    return _chunk_tokens(_encode_text(text), chunk_size, overlap)
+
+
+def _chunk_tokens(tokens: List[int], chunk_size: int, overlap: int = CHUNK_OVERLAP) -> List[str]:
+    """Split an already-encoded token list into overlapping text chunks."""
+    if not tokens:
+        return []
+    
+    # Each chunk starts (chunk_size - overlap) tokens after the previous one;
+    # stop once a chunk reaches the end so no chunk is pure overlap
+    step = max(1, chunk_size - overlap)
+    starts = range(0, max(len(tokens) - overlap, 1), step)
+    token_slices = [tokens[start:start + chunk_size] for start in starts]
+    
+    # Decode all chunks in one call into tiktoken's native core
+    return _get_encoding().decode_batch(token_slices)
+
+
+def _combine_summaries(summaries: List[str]) -> tuple[str, int]:
+    """
+    Join chunk summaries into the reduce-stage text and count its tokens.
     
-    return chunks
+    The joined text is encoded as a whole: cl100k can merge the "\n\n"
+    separators with neighbouring whitespace, so per-section counts would
+    not add up to the exact total.
+    """
+    combined = "\n\n".join(f"Section {i}:\n{s}" for i, s in enumerate(summaries, 1))
+    return combined, len(_get_encoding().encode_ordinary(combined))
+
+
+def _group_summaries(summaries: List[str], budget: int) -> List[List[str]]:
+    """Greedily pack consecutive summaries into groups of at most budget tokens."""
+    groups: List[List[str]] = []
+    group: List[str] = []
+    group_tokens = 0
+    
+    for summary, tokens in zip(summaries, _get_encoding().encode_ordinary_batch(summaries)):
+        # Section header and separator cost a few tokens on top of the summary
+        size = len(tokens) + 8
+        if group and group_tokens + size > budget:
+            groups.append(group)
+            group, group_tokens = [], 0
+        group.append(summary)
+        group_tokens += size
+    
+    if group:
+        groups.append(group)
+    return groups
+
+
+def _batch_summarize(
+    llm: ChatOllama,
+    texts: List[str],
+    prompt: str,
+    max_concurrency: int
+) -> List[str]:
+    """Summarize texts with one llm.batch call (results keep input order)."""
+    responses = llm.batch(
+        [[HumanMessage(content=prompt.format(text=text))] for text in texts],
+        config={"max_concurrency": max_concurrency}
+    )
+    return [response.content for response in responses]
+
+
+def _build_result(
+    summary: str,
+    original_tokens: int,
+    chunk_summaries: List[str],
+    combined_tokens: int,
+    reduce_rounds: int,
+    final_tokens: int,
+    return_chunk_summaries: bool = False
+) -> dict:
+    """Assemble the summary/stats dict returned by all summarize functions."""
+    stats = {
+        'original_tokens': original_tokens,
+        'num_chunks': len(chunk_summaries),
+        'combined_tokens': combined_tokens,
+        'reduce_rounds': reduce_rounds,
+        'final_tokens': final_tokens,
+        'compression_ratio': final_tokens / original_tokens if original_tokens else 0.0
+    }
+    # Per-chunk summaries can be large for big inputs; only keep them on request
+    if return_chunk_summaries:
+        stats['chunk_summaries'] = chunk_summaries
+    return {'summary': summary, 'stats': stats}
 
 
 def summarize_large_text(
@@ -111,7 +283,9 @@ def summarize_large_text(
     llm: ChatOllama,
     max_final_tokens: int = 500,
     context_limit: int = 4000,
-    show_progress: bool = True
+    show_progress: bool = True,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    return_chunk_summaries: bool = False
 ) -> dict:
     """
     Summarize text larger than LLM context using map-reduce approach.
@@ -127,6 +301,8 @@ def summarize_large_text(
         max_final_tokens: Target tokens for final summary
         context_limit: LLM context window size
         show_progress: Print progress messages
+        max_concurrency: Maximum chunk summaries in flight at once
+        return_chunk_summaries: Include per-chunk summaries in stats
     
     Returns:
         {
@@ -134,14 +310,38 @@ def summarize_large_text(
             'stats': {
                 'original_tokens': int,
                 'num_chunks': int,
-                'chunk_summaries': List[str],
                 'combined_tokens': int,
-                'final_tokens': int
+                'reduce_rounds': int,
+                'final_tokens': int,
+                'compression_ratio': float,
+                'chunk_summaries': List[str]  # only if return_chunk_summaries
             }
         }
     """
-    # Count tokens
-    total_tokens = count_tokens(text)
+    # Encode once: the token list is reused for counting and chunking
+    return _summarize_tokens(
+        _encode_text(text), llm,
+        max_final_tokens=max_final_tokens,
+        context_limit=context_limit,
+        show_progress=show_progress,
+        max_concurrency=max_concurrency,
+        return_chunk_summaries=return_chunk_summaries,
+        text=text
+    )
+
+
+def _summarize_tokens(
+    tokens: List[int],
+    llm: ChatOllama,
+    max_final_tokens: int = 500,
+    context_limit: int = 4000,
+    show_progress: bool = True,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    return_chunk_summaries: bool = False,
+    text: Optional[str] = None
+) -> dict:
+    """Map-reduce summarize pre-encoded text (text is decoded only if needed)."""
+    total_tokens = len(tokens)
     
     if show_progress:
         print(f"Original text: {total_tokens:,} tokens")
@@ -151,62 +351,285 @@ def summarize_large_text(
         if show_progress:
             print("Text fits in context - using direct summary")
         
-        prompt = f"""Summarize the following text concisely in approximately {max_final_tokens} tokens:
-
-{text}"""
+        if text is None:
+            text = _get_encoding().decode(tokens)
+        prompt = DIRECT_PROMPT.format(max_tokens=max_final_tokens, text=text)
         
         response = llm.invoke([HumanMessage(content=prompt)])
         summary = response.content
+        summary_tokens = count_tokens(summary)
         
-        return {
-            'summary': summary,
-            'stats': {
-                'original_tokens': total_tokens,
-                'num_chunks': 1,
-                'chunk_summaries': [summary],
-                'combined_tokens': count_tokens(summary),
-                'final_tokens': count_tokens(summary)
-            }
-        }
+        return _build_result(
+            summary, total_tokens,
+            chunk_summaries=[summary],
+            combined_tokens=summary_tokens,
+            reduce_rounds=0,
+            final_tokens=summary_tokens,
+            return_chunk_summaries=return_chunk_summaries
+        )
     
     # Calculate optimal chunking
     num_chunks, chunk_size = calculate_optimal_chunks(
         total_tokens,
-        context_limit=context_limit,
-        target_combined_tokens=context_limit - 500  # Leave room for prompt
+        context_limit=context_limit
     )
     
     if show_progress:
         print(f"Strategy: {num_chunks} chunks × ~{chunk_size:,} tokens")
     
-    # Split text into chunks
-    chunks = chunk_text_by_tokens(text, chunk_size)
+    # Split tokens into chunks
+    chunks = _chunk_tokens(tokens, chunk_size)
     
     if show_progress:
         print(f"Created {len(chunks)} chunks")
     
-    # Stage 1: Summarize each chunk
-    chunk_summaries = []
-    for i, chunk in enumerate(chunks, 1):
+    # Stage 1: Summarize chunks as one batch; LangChain keeps up to
+    # max_concurrency requests in flight so Ollama can batch them
+    if show_progress:
+        print(f"Summarizing {len(chunks)} chunks ({max_concurrency} at a time)...", end=" ", flush=True)
+    
+    chunk_summaries = _batch_summarize(llm, chunks, CHUNK_PROMPT, max_concurrency)
+    
+    if show_progress:
+        print("✓")
+    
+    # Combine all chunk summaries
+    combined, combined_tokens = _combine_summaries(chunk_summaries)
+    
+    # Tree reduce: while the summaries don't fit one call, summarize groups
+    # of them that do, until the final prompt fits the context window
+    budget = context_limit - PROMPT_MARGIN
+    summaries = chunk_summaries
+    reduce_rounds = 0
+    while combined_tokens > budget and len(summaries) > 1:
+        groups = _group_summaries(summaries, budget)
+        if len(groups) == len(summaries):
+            break  # every summary alone is over budget; nothing left to merge
+        
         if show_progress:
-            print(f"Summarizing chunk {i}/{len(chunks)}...", end=" ", flush=True)
+            print(f"Combined summaries: {combined_tokens:,} tokens - reducing {len(summaries)} → {len(groups)}...", end=" ", flush=True)
         
-        prompt = f"""Summarize the following text section concisely, preserving key information:
+        summaries = _batch_summarize(
+            llm, [_combine_summaries(group)[0] for group in groups], REDUCE_PROMPT, max_concurrency
+        )
+        combined, combined_tokens = _combine_summaries(summaries)
+        reduce_rounds += 1
+        
+        if show_progress:
+            print("✓")
+    
+    if show_progress:
+        print(f"\nCombined summaries: {combined_tokens:,} tokens")
+    
+    # Stage 2: Final summary
+    if show_progress:
+        print("Creating final summary...", end=" ", flush=True)
+    
+    final_prompt = FINAL_PROMPT.format(max_tokens=max_final_tokens, text=combined)
+    
+    response = llm.invoke([HumanMessage(content=final_prompt)])
+    final_summary = response.content
+    final_tokens = count_tokens(final_summary)
+    
+    if show_progress:
+        print(f"✓ ({final_tokens} tokens)")
+        print(f"\nCompression: {total_tokens:,} → {final_tokens} tokens ({final_tokens/total_tokens*100:.1f}%)")
+    
+    return _build_result(
+        final_summary, total_tokens,
+        chunk_summaries=list(chunk_summaries),
+        combined_tokens=combined_tokens,
+        reduce_rounds=reduce_rounds,
+        final_tokens=final_tokens,
+        return_chunk_summaries=return_chunk_summaries
+    )
 
-{chunk}
 
-Summary:"""
+class _Progress:
+    """Counts finished LLM calls and forwards them to an optional callback."""
+    
+    def __init__(self, callback: Optional[ProgressCallback], total: int):
+        self.callback = callback
+        self.done = 0
+        self.total = total
+    
+    async def report(self, partial: float = 0.0) -> None:
+        if self.callback is not None:
+            await self.callback(self.done + partial, self.total)
+    
+    async def step(self) -> None:
+        self.done += 1
+        await self.report()
+
+
+async def _asummarize_chunk(
+    llm: ChatOllama,
+    chunk: str,
+    semaphore: asyncio.Semaphore,
+    prompt: str = CHUNK_PROMPT,
+    progress: Optional[_Progress] = None
+) -> str:
+    """Summarize one chunk, waiting for a free concurrency slot first."""
+    async with semaphore:
+        response = await llm.ainvoke([HumanMessage(content=prompt.format(text=chunk))])
+    if progress is not None:
+        await progress.step()
+    return response.content
+
+
+async def _astream_summary(llm: ChatOllama, prompt: str, max_tokens: int, progress: _Progress) -> str:
+    """
+    Stream one summary from the LLM, reporting partial progress as it arrives.
+    
+    Progress within the call is estimated from streamed pieces against
+    max_tokens and reported in 5% steps (capped below completion).
+    """
+    parts: List[str] = []
+    reported = 0.0
+    async for piece in llm.astream([HumanMessage(content=prompt)]):
+        parts.append(piece.content)
+        fraction = min(len(parts) / max(max_tokens, 1), 0.95)
+        if fraction - reported >= 0.05:
+            reported = fraction
+            await progress.report(fraction)
+    await progress.step()
+    return "".join(parts)
+
+
+async def asummarize_large_text(
+    text: str,
+    llm: ChatOllama,
+    max_final_tokens: int = 500,
+    context_limit: int = 4000,
+    show_progress: bool = True,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    return_chunk_summaries: bool = False,
+    on_progress: Optional[ProgressCallback] = None
+) -> dict:
+    """
+    Async version of summarize_large_text.
+    
+    The map stage sends up to max_concurrency chunk prompts to the LLM at
+    once, so an N-chunk document no longer costs N sequential round trips.
+    
+    Args:
+        text: Large text to summarize
+        llm: LangChain LLM instance (ChatOllama, ChatOpenAI, etc.)
+        max_final_tokens: Target tokens for final summary
+        context_limit: LLM context window size
+        show_progress: Print progress messages
+        max_concurrency: Maximum chunk summaries in flight at once
+        return_chunk_summaries: Include per-chunk summaries in stats
+        on_progress: Async callback(completed, total) awaited after each LLM
+            call; the final summary is streamed and reports partial progress
+    
+    Returns:
+        Same as summarize_large_text()
+    """
+    # Encode once (in a worker thread, so large inputs don't stall the event loop)
+    tokens = await asyncio.to_thread(_encode_text, text)
+    return await _asummarize_tokens(
+        tokens, llm,
+        max_final_tokens=max_final_tokens,
+        context_limit=context_limit,
+        show_progress=show_progress,
+        max_concurrency=max_concurrency,
+        return_chunk_summaries=return_chunk_summaries,
+        on_progress=on_progress,
+        text=text
+    )
+
+
+async def _asummarize_tokens(
+    tokens: List[int],
+    llm: ChatOllama,
+    max_final_tokens: int = 500,
+    context_limit: int = 4000,
+    show_progress: bool = True,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    return_chunk_summaries: bool = False,
+    on_progress: Optional[ProgressCallback] = None,
+    text: Optional[str] = None
+) -> dict:
+    """Async map-reduce summarize of pre-encoded text."""
+    total_tokens = len(tokens)
+    
+    if show_progress:
+        print(f"Original text: {total_tokens:,} tokens")
+    
+    # Check if text is small enough for direct summary
+    if total_tokens <= context_limit:
+        if show_progress:
+            print("Text fits in context - using direct summary")
         
-        response = llm.invoke([HumanMessage(content=prompt)])
-        chunk_summary = response.content
-        chunk_summaries.append(chunk_summary)
+        if text is None:
+            text = _get_encoding().decode(tokens)
+        prompt = DIRECT_PROMPT.format(max_tokens=max_final_tokens, text=text)
         
-        if show_progress:
-            print(f"✓ ({count_tokens(chunk_summary)} tokens)")
+        summary = await _astream_summary(llm, prompt, max_final_tokens, _Progress(on_progress, 1))
+        summary_tokens = count_tokens(summary)
+        
+        return _build_result(
+            summary, total_tokens,
+            chunk_summaries=[summary],
+            combined_tokens=summary_tokens,
+            reduce_rounds=0,
+            final_tokens=summary_tokens,
+            return_chunk_summaries=return_chunk_summaries
+        )
+    
+    # Calculate optimal chunking
+    num_chunks, chunk_size = calculate_optimal_chunks(
+        total_tokens,
+        context_limit=context_limit
+    )
+    
+    if show_progress:
+        print(f"Strategy: {num_chunks} chunks × ~{chunk_size:,} tokens")
+    
+    # Split tokens into chunks
+    chunks = _chunk_tokens(tokens, chunk_size)
+    
+    if show_progress:
+        print(f"Created {len(chunks)} chunks")
+        print(f"Summarizing {len(chunks)} chunks ({max_concurrency} at a time)...", end=" ", flush=True)
+    
+    # Stage 1: Summarize chunks concurrently (results keep chunk order).
+    # Progress counts LLM calls: one per chunk plus the final summary
+    progress = _Progress(on_progress, len(chunks) + 1)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    chunk_summaries = await asyncio.gather(*(
+        _asummarize_chunk(llm, chunk, semaphore, progress=progress) for chunk in chunks
+    ))
+    
+    if show_progress:
+        print("✓")
     
     # Combine all chunk summaries
-    combined = "\n\n".join([f"Section {i+1}:\n{s}" for i, s in enumerate(chunk_summaries)])
-    combined_tokens = count_tokens(combined)
+    combined, combined_tokens = _combine_summaries(chunk_summaries)
+    
+    # Tree reduce (see _summarize_tokens); each level's groups run concurrently
+    budget = context_limit - PROMPT_MARGIN
+    summaries = chunk_summaries
+    reduce_rounds = 0
+    while combined_tokens > budget and len(summaries) > 1:
+        groups = _group_summaries(summaries, budget)
+        if len(groups) == len(summaries):
+            break  # every summary alone is over budget; nothing left to merge
+        
+        if show_progress:
+            print(f"Combined summaries: {combined_tokens:,} tokens - reducing {len(summaries)} → {len(groups)}...", end=" ", flush=True)
+        
+        progress.total += len(groups)
+        summaries = await asyncio.gather(*(
+            _asummarize_chunk(llm, _combine_summaries(group)[0], semaphore, REDUCE_PROMPT, progress)
+            for group in groups
+        ))
+        combined, combined_tokens = _combine_summaries(summaries)
+        reduce_rounds += 1
+        
+        if show_progress:
+            print("✓")
     
     if show_progress:
         print(f"\nCombined summaries: {combined_tokens:,} tokens")
@@ -215,39 +638,78 @@ Summary:"""
     if show_progress:
         print("Creating final summary...", end=" ", flush=True)
     
-    final_prompt = f"""Create a comprehensive summary of the following section summaries in approximately {max_final_tokens} tokens.
-Focus on main themes, key points, and important conclusions:
-
-{combined}
-
-Final Summary:"""
+    final_prompt = FINAL_PROMPT.format(max_tokens=max_final_tokens, text=combined)
     
-    response = llm.invoke([HumanMessage(content=final_prompt)])
-    final_summary = response.content
+    final_summary = await _astream_summary(llm, final_prompt, max_final_tokens, progress)
     final_tokens = count_tokens(final_summary)
     
     if show_progress:
         print(f"✓ ({final_tokens} tokens)")
         print(f"\nCompression: {total_tokens:,} → {final_tokens} tokens ({final_tokens/total_tokens*100:.1f}%)")
     
-    return {
-        'summary': final_summary,
-        'stats': {
-            'original_tokens': total_tokens,
-            'num_chunks': len(chunks),
-            'chunk_summaries': chunk_summaries,
-            'combined_tokens': combined_tokens,
-            'final_tokens': final_tokens,
-            'compression_ratio': final_tokens / total_tokens
-        }
-    }
+    return _build_result(
+        final_summary, total_tokens,
+        chunk_summaries=list(chunk_summaries),
+        combined_tokens=combined_tokens,
+        reduce_rounds=reduce_rounds,
+        final_tokens=final_tokens,
+        return_chunk_summaries=return_chunk_summaries
+    )
+
+
+def _last_safe_cut(text: str) -> int:
+    """
+    Offset of the last line start in text that begins with a non-space
+    character (0 if there is none).
+    
+    Like the cuts in _split_on_lines, tiktoken never merges tokens across
+    such a boundary, so text[:cut] and text[cut:] can be encoded separately.
+    """
+    cut = text.rfind("\n")
+    while cut != -1:
+        if cut + 1 < len(text) and not text[cut + 1].isspace():
+            return cut + 1
+        cut = text.rfind("\n", 0, cut)
+    return 0
+
+
+def _encode_file(file_path: str, encoding: str = 'utf-8') -> List[int]:
+    """
+    Tokenize a text file without holding its full contents in memory.
+    
+    Reads ~FILE_READ_SIZE bytes of whole lines at a time and extends a single
+    token list, so only one block of raw text is alive at any point. Each
+    block is encoded up to its last safe cut and the remainder is carried
+    into the next one, so the tokens match encoding the whole file at once.
+    """
+    tokenizer = _get_encoding()
+    tokens: List[int] = []
+    pending = ""
+    
+    with open(file_path, 'r', encoding=encoding) as f:
+        while True:
+            lines = f.readlines(FILE_READ_SIZE)
+            if not lines:
+                break
+            text = pending + "".join(lines)
+            cut = _last_safe_cut(text)
+            tokens.extend(tokenizer.encode_ordinary(text[:cut]))
+            pending = text[cut:]
+    
+    if pending:
+        tokens.extend(tokenizer.encode_ordinary(pending))
+    
+    return tokens
 
 
 def summarize_file(
     file_path: str,
     llm: ChatOllama,
     max_final_tokens: int = 500,
-    encoding: str = 'utf-8'
+    encoding: str = 'utf-8',
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    return_chunk_summaries: bool = False,
+    show_progress: bool = True
 ) -> dict:
     """
     Summarize text from a file.
@@ -257,11 +719,55 @@ def summarize_file(
         llm: LangChain LLM instance
         max_final_tokens: Target tokens for final summary
         encoding: File encoding
+        max_concurrency: Maximum chunk summaries in flight at once
+        return_chunk_summaries: Include per-chunk summaries in stats
+        show_progress: Print progress messages
     
     Returns:
         Same as summarize_large_text()
     """
-    with open(file_path, 'r', encoding=encoding) as f:
-        text = f.read()
+    return _summarize_tokens(
+        _encode_file(file_path, encoding), llm,
+        max_final_tokens=max_final_tokens,
+        max_concurrency=max_concurrency,
+        return_chunk_summaries=return_chunk_summaries,
+        show_progress=show_progress
+    )
+
+
+async def asummarize_file(
+    file_path: str,
+    llm: ChatOllama,
+    max_final_tokens: int = 500,
+    encoding: str = 'utf-8',
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    return_chunk_summaries: bool = False,
+    show_progress: bool = True,
+    on_progress: Optional[ProgressCallback] = None
+) -> dict:
+    """
+    Async version of summarize_file.
     
-    return summarize_large_text(text, llm, max_final_tokens=max_final_tokens)
+    Args:
+        file_path: Path to text file
+        llm: LangChain LLM instance
+        max_final_tokens: Target tokens for final summary
+        encoding: File encoding
+        max_concurrency: Maximum chunk summaries in flight at once
+        return_chunk_summaries: Include per-chunk summaries in stats
+        show_progress: Print progress messages
+        on_progress: Async progress callback (see asummarize_large_text)
+    
+    Returns:
+        Same as summarize_large_text()
+    """
+    # File reading and tokenization are blocking; keep them off the event loop
+    tokens = await asyncio.to_thread(_encode_file, file_path, encoding)
+    return await _asummarize_tokens(
+        tokens, llm,
+        max_final_tokens=max_final_tokens,
+        max_concurrency=max_concurrency,
+        return_chunk_summaries=return_chunk_summaries,
+        show_progress=show_progress,
+        on_progress=on_progress
+    )
@@ -7,6 +7,9 @@ Supports models like llama3.2-vision, gemma3, and others.
 
 import os
 import time
+import base64
+import hashlib
+from collections import OrderedDict
 from ollama import Client
 from dotenv import load_dotenv
 
@@ -16,43 +19,91 @@ load_dotenv()
 OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://localhost:11434")
 MODEL = os.getenv("VLM_MODEL", "llama3.2-vision:latest")
 IMAGE_PATH = os.getenv("IMAGE_PATH", "example.jpg")
+# How long Ollama keeps the model loaded between requests
+KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+# Number of (model, image, system prompt, query, temperature) answers kept in memory
+RESPONSE_CACHE_SIZE = int(os.getenv("VLM_RESPONSE_CACHE_SIZE", 256))
 
+# LRU of final responses: repeating a question about the same image skips
+# the vision encoder and generation entirely
+_response_cache = OrderedDict()
 
-def analyze_image_simple(client, model, image_path, query, temperature=0.1):
-    """Simple image analysis with text query."""
-    messages = [{
-        'role': 'user',
-        'content': query,
-        'images': [image_path]
-    }]
+
+def load_image(image_path):
+    """
+    Read an image once and return (sha256 hex digest, base64 data).
     
-    response = client.chat(
-        model=model,
-        messages=messages,
-        options={"temperature": temperature}
-    )
+    The base64 string can be sent on every request without touching the
+    disk again; the digest identifies the image content.
+    """
+    with open(image_path, "rb") as f:
+        data = f.read()
+    return hashlib.sha256(data).hexdigest(), base64.b64encode(data).decode()
+
+
+def stream_chat(client, model, messages, temperature, print_stream=False):
+    """
+    Run a chat request with streaming and return the full response text.
     
-    return response["message"]["content"]
-
-
-def analyze_image_with_system(client, model, image_path, query, system_prompt, temperature=0.1):
-    """Image analysis with custom system prompt."""
-    messages = [
-        {'role': 'system', 'content': system_prompt},
-        {
-            'role': 'user',
-            'content': query,
-            'images': [image_path]
-        }
-    ]
+    With print_stream=True tokens are printed as they arrive, followed by
+    the time to first token.
+    """
+    start = time.time()
+    first_token_time = None
+    parts = []
     
-    response = client.chat(
+    for part in client.chat(
         model=model,
         messages=messages,
-        options={"temperature": temperature}
-    )
+        options={"temperature": temperature},
+        keep_alive=KEEP_ALIVE,
+        stream=True
+    ):
+        content = part["message"]["content"]
+        if first_token_time is None:
+            first_token_time = time.time() - start
+        if print_stream:
+            print(content, end="", flush=True)
+        parts.append(content)
     
-    return response["message"]["content"]
+    if print_stream:
+        print(f"\nFirst token: {first_token_time or 0.0:.2f}s")
+    
+    return "".join(parts)
+
+
+def _cached_chat(client, model, image, query, system_prompt, temperature, print_stream):
+    """Answer from the response cache, or run the chat and cache the result."""
+    image_hash, image_b64 = image
+    key = (model, image_hash, system_prompt, query, temperature)
+    
+    response = _response_cache.get(key)
+    if response is not None:
+        _response_cache.move_to_end(key)
+        if print_stream:
+            print(response)
+            print("(cached)")
+        return response
+    
+    messages = [{'role': 'user', 'content': query, 'images': [image_b64]}]
+    if system_prompt is not None:
+        messages.insert(0, {'role': 'system', 'content': system_prompt})
+    
+    response = stream_chat(client, model, messages, temperature, print_stream)
+    _response_cache[key] = response
+    if len(_response_cache) > RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+    return response
+
+
+def analyze_image_simple(client, model, image, query, temperature=0.1, print_stream=False):
+    """Simple image analysis with text query (image as returned by load_image)."""
+    return _cached_chat(client, model, image, query, None, temperature, print_stream)
+
+
+def analyze_image_with_system(client, model, image, query, system_prompt, temperature=0.1, print_stream=False):
+    """Image analysis with custom system prompt (image as returned by load_image)."""
+    return _cached_chat(client, model, image, query, system_prompt, temperature, print_stream)
 
 
 def main():
@@ -66,14 +117,18 @@ def main():
         print("Set IMAGE_PATH environment variable")
         return
     
+    # Read and encode the image once; every request reuses it
+    image = load_image(IMAGE_PATH)
+    
     # Example 1: Simple query
     print("\n=== Example 1: Simple Image Description ===")
     start = time.time()
-    result = analyze_image_simple(
-        client, MODEL, IMAGE_PATH,
-        "Describe what you see in this image"
+    print("Response: ", end="")
+    analyze_image_simple(
+        client, MODEL, image,
+        "Describe what you see in this image",
+        print_stream=True
     )
-    print(f"Response: {result}")
     print(f"Time: {time.time() - start:.2f}s")
     
     # Example 2: With system prompt
@@ -87,10 +142,11 @@ def main():
         "Analyze this image for safety hazards. "
         "Rate the risk level (0-10) and identify specific concerns."
     )
-    result = analyze_image_with_system(
-        client, MODEL, IMAGE_PATH, query, system_prompt
+    print("Response: ", end="")
+    analyze_image_with_system(
+        client, MODEL, image, query, system_prompt,
+        print_stream=True
     )
-    print(f"Response: {result}")
     print(f"Time: {time.time() - start:.2f}s")
     
     # Interactive mode
@@ -101,8 +157,8 @@ def main():
             break
         
         start = time.time()
-        result = analyze_image_simple(client, MODEL, IMAGE_PATH, query)
-        print(f"\nResponse: {result}")
+        print("\nResponse: ", end="")
+        analyze_image_simple(client, MODEL, image, query, print_stream=True)
         print(f"Time: {time.time() - start:.2f}s")
 
 
@@ -6,18 +6,118 @@ basic mode, and RSS feed support.
 """
 
 import os
-from typing import Optional, List, Dict, Any
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, Awaitable, Callable, Hashable
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, HttpUrl
+from brotli_asgi import BrotliMiddleware
 import asyncio
 from crawl4ai import AsyncWebCrawler
 from crawl4ai.extraction_strategy import LLMExtractionStrategy
 import feedparser
+import httpx
 from dotenv import load_dotenv
 
 load_dotenv()
 
-app = FastAPI(title="Crawl4AI MCP Service")
+# Local LLM used for extraction
+LLM_PROVIDER = "ollama/qwen2.5:7b"
+OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://host.docker.internal:11434")
+
+# Max pages being crawled at once across all requests (browser tabs/sockets)
+CRAWL_CONCURRENCY = int(os.getenv("CRAWL_CONCURRENCY", 8))
+
+# Crawls currently running, by request signature (see _single_flight)
+_inflight: Dict[Hashable, "asyncio.Task"] = {}
+
+# Parsed RSS feeds by URL with their ETag, so unchanged feeds skip the parse
+RSS_CACHE_SIZE = 128
+_rss_cache: Dict[str, tuple] = {}
+# Fields copied from each feed entry into the response
+RSS_ENTRY_FIELDS = ("title", "link", "published", "summary", "author")
+
+# Stealth configuration
+STEALTH_BROWSER_CONFIG = {
+    "headless": True,
+    "viewport": {"width": 1920, "height": 1080},
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
+
+
+def get_llm_strategy(provider: str, prompt: str) -> LLMExtractionStrategy:
+    """
+    Fresh extraction strategy for one request.
+    
+    Strategies accumulate token usage (usages/total_usage) on every
+    extraction, so they are not shared across requests.
+    """
+    return LLMExtractionStrategy(
+        provider=provider,
+        api_base=OLLAMA_BASE_URL,
+        instruction=prompt
+    )
+
+
+def _json_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model with pydantic's Rust encoder.
+    
+    Returning a Response skips FastAPI's re-validation and jsonable_encoder
+    pass, which dominate the cost for large markdown content.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+async def _arun(crawler: AsyncWebCrawler, **kwargs) -> Any:
+    """crawler.arun bounded by the service-wide crawl semaphore."""
+    async with app.state.crawl_semaphore:
+        return await crawler.arun(**kwargs)
+
+
+async def _single_flight(key: Hashable, make: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run make() once per key at a time: identical requests arriving while the
+    first is still running await its result instead of crawling again.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(make())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # shield: a caller disconnecting must not cancel the others' crawl
+    return await asyncio.shield(task)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup: launch one browser per mode and keep it for the app's lifetime
+    app.state.basic_crawler = AsyncWebCrawler(verbose=False)
+    app.state.stealth_crawler = AsyncWebCrawler(
+        verbose=False,
+        browser_type="chromium",
+        **STEALTH_BROWSER_CONFIG
+    )
+    await app.state.basic_crawler.__aenter__()
+    await app.state.stealth_crawler.__aenter__()
+    app.state.crawl_semaphore = asyncio.Semaphore(CRAWL_CONCURRENCY)
+    # Shared HTTP client for RSS fetches
+    app.state.http = httpx.AsyncClient(timeout=15, follow_redirects=True)
+    yield
+    # Shutdown: close the browsers and HTTP client
+    await app.state.basic_crawler.__aexit__(None, None, None)
+    await app.state.stealth_crawler.__aexit__(None, None, None)
+    await app.state.http.aclose()
+
+
+app = FastAPI(
+    title="Crawl4AI MCP Service",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+# Page markdown compresses well; clients without br get gzip
+app.add_middleware(BrotliMiddleware, quality=4, minimum_size=2048)
 
 
 class CrawlRequest(BaseModel):
@@ -39,6 +139,18 @@ class CrawlResponse(BaseModel):
     error: Optional[str] = None
 
 
+class BatchCrawlRequest(BaseModel):
+    """Request model for crawling several URLs in one call."""
+    urls: List[HttpUrl]
+    extract_content: bool = True
+    extract_links: bool = False
+
+
+class BatchCrawlResponse(BaseModel):
+    """Response model for batch crawling (one result per URL, in order)."""
+    results: List[CrawlResponse]
+
+
 class RSSRequest(BaseModel):
     """Request model for RSS feeds."""
     url: HttpUrl
@@ -62,44 +174,37 @@ async def health():
     }
 
 
-@app.post("/crawl/basic", response_model=CrawlResponse)
-async def crawl_basic(request: CrawlRequest):
-    """
-    Basic web crawling mode.
-    
-    Standard crawling without anti-detection measures.
-    Faster but may be blocked by some sites.
-    """
+async def _crawl_basic(request: CrawlRequest) -> CrawlResponse:
+    """Crawl one URL with the shared basic browser."""
     try:
-        async with AsyncWebCrawler(verbose=False) as crawler:
-            result = await crawler.arun(
+        # Shared browser launched at startup
+        crawler = app.state.basic_crawler
+        result = await _arun(
+            crawler,
+            url=str(request.url),
+            bypass_cache=True
+        )
+        
+        response_data = {
+            "success": True,
+            "url": str(request.url),
+            "content": result.markdown if request.extract_content else None,
+            "links": result.links.get("external", []) if request.extract_links else None
+        }
+        
+        # LLM extraction if requested
+        if request.llm_extract and request.llm_prompt:
+            # Use local LLM for extraction
+            llm_strategy = get_llm_strategy(LLM_PROVIDER, request.llm_prompt)
+            extracted = await _arun(
+                crawler,
                 url=str(request.url),
-                bypass_cache=True
+                extraction_strategy=llm_strategy
             )
-            
-            response_data = {
-                "success": True,
-                "url": str(request.url),
-                "content": result.markdown if request.extract_content else None,
-                "links": result.links.get("external", []) if request.extract_links else None
-            }
-            
-            # LLM extraction if requested
-            if request.llm_extract and request.llm_prompt:
-                # Use local LLM for extraction
-                llm_strategy = LLMExtractionStrategy(
-                    provider="ollama/qwen2.5:7b",
-                    api_base=os.getenv("OLLAMA_BASE_URL", "http://host.docker.internal:11434"),
-                    instruction=request.llm_prompt
-                )
-                extracted = await crawler.arun(
-                    url=str(request.url),
-                    extraction_strategy=llm_strategy
-                )
-                response_data["llm_extracted"] = extracted.extracted_content
-            
-            return CrawlResponse(**response_data)
-            
+            response_data["llm_extracted"] = extracted.extracted_content
+        
+        return CrawlResponse(**response_data)
+        
     except Exception as e:
         return CrawlResponse(
             success=False,
@@ -108,56 +213,39 @@ async def crawl_basic(request: CrawlRequest):
         )
 
 
-@app.post("/crawl/stealth", response_model=CrawlResponse)
-async def crawl_stealth(request: CrawlRequest):
-    """
-    Stealth web crawling mode.
-    
-    Uses anti-detection techniques to avoid being blocked.
-    Slower but more reliable for protected sites.
-    """
+async def _crawl_stealth(request: CrawlRequest) -> CrawlResponse:
+    """Crawl one URL with the shared stealth browser."""
     try:
-        # Stealth configuration
-        browser_config = {
-            "headless": True,
-            "viewport": {"width": 1920, "height": 1080},
-            "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        # Shared stealth browser launched at startup
+        crawler = app.state.stealth_crawler
+        result = await _arun(
+            crawler,
+            url=str(request.url),
+            bypass_cache=True,
+            wait_for="networkidle",  # Wait for page to fully load
+            delay_before_return_html=2.0  # Extra delay for JS rendering
+        )
+        
+        response_data = {
+            "success": True,
+            "url": str(request.url),
+            "content": result.markdown if request.extract_content else None,
+            "links": result.links.get("external", []) if request.extract_links else None
         }
         
-        async with AsyncWebCrawler(
-            verbose=False,
-            browser_type="chromium",
-            **browser_config
-        ) as crawler:
-            result = await crawler.arun(
+        # LLM extraction if requested
+        if request.llm_extract and request.llm_prompt:
+            # Use local LLM for extraction
+            llm_strategy = get_llm_strategy(LLM_PROVIDER, request.llm_prompt)
+            extracted = await _arun(
+                crawler,
                 url=str(request.url),
-                bypass_cache=True,
-                wait_for="networkidle",  # Wait for page to fully load
-                delay_before_return_html=2.0  # Extra delay for JS rendering
+                extraction_strategy=llm_strategy
             )
-            
-            response_data = {
-                "success": True,
-                "url": str(request.url),
-                "content": result.markdown if request.extract_content else None,
-                "links": result.links.get("external", []) if request.extract_links else None
-            }
-            
-            # LLM extraction if requested
-            if request.llm_extract and request.llm_prompt:
-                llm_strategy = LLMExtractionStrategy(
-                    provider="ollama/qwen2.5:7b",
-                    api_base=os.getenv("OLLAMA_BASE_URL", "http://host.docker.internal:11434"),
-                    instruction=request.llm_prompt
-                )
-                extracted = await crawler.arun(
-                    url=str(request.url),
-                    extraction_strategy=llm_strategy
-                )
-                response_data["llm_extracted"] = extracted.extracted_content
-            
-            return CrawlResponse(**response_data)
-            
+            response_data["llm_extracted"] = extracted.extracted_content
+        
+        return CrawlResponse(**response_data)
+        
     except Exception as e:
         return CrawlResponse(
             success=False,
@@ -166,6 +254,87 @@ async def crawl_stealth(request: CrawlRequest):
         )
 
 
+@app.post("/crawl/basic", response_model=CrawlResponse)
+async def crawl_basic(request: CrawlRequest):
+    """
+    Basic web crawling mode.
+    
+    Standard crawling without anti-detection measures.
+    Faster but may be blocked by some sites.
+    """
+    return _json_response(await _single_flight(
+        ("basic", request.model_dump_json()),
+        lambda: _crawl_basic(request)
+    ))
+
+
+@app.post("/crawl/stealth", response_model=CrawlResponse)
+async def crawl_stealth(request: CrawlRequest):
+    """
+    Stealth web crawling mode.
+    
+    Uses anti-detection techniques to avoid being blocked.
+    Slower but more reliable for protected sites.
+    """
+    return _json_response(await _single_flight(
+        ("stealth", request.model_dump_json()),
+        lambda: _crawl_stealth(request)
+    ))
+
+
+def _batch_result(url: str, result: Any, request: BatchCrawlRequest) -> CrawlResponse:
+    """Convert one arun_many result into a CrawlResponse."""
+    if not result.success:
+        return CrawlResponse(success=False, url=url, error=result.error_message)
+    return CrawlResponse(
+        success=True,
+        url=url,
+        content=result.markdown if request.extract_content else None,
+        links=result.links.get("external", []) if request.extract_links else None
+    )
+
+
+async def _crawl_many(crawler: AsyncWebCrawler, request: BatchCrawlRequest, **crawl_kwargs) -> BatchCrawlResponse:
+    """Crawl all URLs in one browser, at most CRAWL_CONCURRENCY pages at a time."""
+    urls = [str(url) for url in request.urls]
+    results = await asyncio.gather(
+        *(_arun(crawler, url=url, bypass_cache=True, **crawl_kwargs) for url in urls),
+        return_exceptions=True
+    )
+    
+    return BatchCrawlResponse(results=[
+        CrawlResponse(success=False, url=url, error=str(result))
+        if isinstance(result, Exception)
+        else _batch_result(url, result, request)
+        for url, result in zip(urls, results)
+    ])
+
+
+@app.post("/crawl/basic/batch", response_model=BatchCrawlResponse)
+async def crawl_basic_batch(request: BatchCrawlRequest):
+    """
+    Basic crawling of several URLs at once.
+    
+    Pages are fetched concurrently in the shared basic browser.
+    """
+    return _json_response(await _crawl_many(app.state.basic_crawler, request))
+
+
+@app.post("/crawl/stealth/batch", response_model=BatchCrawlResponse)
+async def crawl_stealth_batch(request: BatchCrawlRequest):
+    """
+    Stealth crawling of several URLs at once.
+    
+    Pages are fetched concurrently in the shared stealth browser.
+    """
+    return _json_response(await _crawl_many(
+        app.state.stealth_crawler,
+        request,
+        wait_for="networkidle",
+        delay_before_return_html=2.0
+    ))
+
+
 @app.post("/rss/fetch", response_model=RSSResponse)
 async def fetch_rss(request: RSSRequest):
     """
@@ -174,40 +343,65 @@ async def fetch_rss(request: RSSRequest):
     Returns feed metadata and entries.
     """
     try:
-        feed = feedparser.parse(str(request.url))
+        url = str(request.url)
+        cached = _rss_cache.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        
+        response = await app.state.http.get(url, headers=headers)
+        etag = response.headers.get("etag")
+        
+        if cached and (response.status_code == 304 or (etag and etag == cached[0])):
+            feed = cached[1]
+        else:
+            response.raise_for_status()
+            # Parsing is CPU-bound; keep it off the event loop
+            feed = await asyncio.to_thread(
+                feedparser.parse,
+                response.content,
+                response_headers=dict(response.headers)  # charset detection
+            )
+            if etag and not feed.bozo:
+                _rss_cache.pop(url, None)
+                _rss_cache[url] = (etag, feed)
+                if len(_rss_cache) > RSS_CACHE_SIZE:
+                    _rss_cache.pop(next(iter(_rss_cache)))
         
         if feed.bozo:  # Error parsing feed
-            return RSSResponse(
+            return _json_response(RSSResponse(
                 success=False,
                 entries=[],
                 error=f"Failed to parse RSS feed: {feed.bozo_exception}"
-            )
+            ))
         
-        entries = []
-        for entry in feed.entries[:request.max_entries]:
-            entries.append({
-                "title": entry.get("title", ""),
-                "link": entry.get("link", ""),
-                "published": entry.get("published", ""),
-                "summary": entry.get("summary", ""),
-                "author": entry.get("author", "")
-            })
+        entries = [
+            {field: entry.get(field, "") for field in RSS_ENTRY_FIELDS}
+            for entry in feed.entries[:request.max_entries]
+        ]
         
-        return RSSResponse(
+        return _json_response(RSSResponse(
             success=True,
             feed_title=feed.feed.get("title", ""),
             entries=entries
-        )
+        ))
         
     except Exception as e:
-        return RSSResponse(
+        return _json_response(RSSResponse(
             success=False,
             entries=[],
             error=str(e)
-        )
+        ))
 
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("SERVICE_PORT", 8003))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Each worker process launches its own pair of browsers
+    workers = int(os.getenv("WORKERS", 1))
+    uvicorn.run(
+        app if workers == 1 else "server:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=workers
+    )
@@ -28,7 +28,28 @@ class MCPAgentClient:
     """Client for MCP agent services with streaming support."""
     
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=300.0)
+        # One pooled client for all services: connections are kept alive and
+        # reused (pool settings live on the transport: httpx ignores the
+        # client's limits argument when a transport is passed)
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(connect=5.0, read=300.0, write=60.0, pool=5.0),
+            transport=httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=60
+                ),
+                retries=1  # retry failed connection attempts once
+            )
+        )
+    
+    async def __aenter__(self) -> "MCPAgentClient":
+        # Pre-warm one connection per service
+        await self.health_check_all()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
     
     async def close(self):
         """Close HTTP client."""
@@ -54,7 +75,8 @@ class MCPAgentClient:
         payload = {
             "command": command,
             "context": context,
-            "auto_run": auto_run
+            "auto_run": auto_run,
+            "stream": stream
         }
         
         if stream:
@@ -194,15 +216,18 @@ class MCPAgentClient:
             "crawl4ai": f"{CRAWL4AI_URL}/health"
         }
         
-        results = {}
-        for name, url in services.items():
+        async def probe(name: str, url: str) -> tuple[str, bool]:
             try:
                 response = await self.client.get(url)
-                results[name] = response.status_code == 200
+                return name, response.status_code == 200
             except:
-                results[name] = False
+                return name, False
         
-        return results
+        # Probe all services concurrently: total time is the slowest probe
+        results = await asyncio.gather(*(
+            probe(name, url) for name, url in services.items()
+        ))
+        return dict(results)
 
 
 # Example usage
@@ -1,13 +1,16 @@
 import os
+import time
 import shutil
+import asyncio
 from pathlib import Path
-from typing import List, Optional
-from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from gpt_researcher import GPTResearcher
+import aiofiles
+from brotli_asgi import BrotliMiddleware
 import uvicorn
 
 
@@ -18,30 +21,55 @@ SESSION_FILES_DIR.mkdir(exist_ok=True)
 # Session cleanup configuration
 SESSION_MAX_AGE_HOURS = 24  # Remove sessions older than 24 hours
 
+# Max research runs in flight at once; defaults to the number of requests
+# Ollama serves in parallel (OLLAMA_NUM_PARALLEL), since each run drives the LLM.
+# The limit is per uvicorn worker process: with WORKERS > 1 the real cap is
+# WORKERS * RESEARCH_CONCURRENCY, so lower it accordingly
+RESEARCH_CONCURRENCY = int(os.getenv("RESEARCH_CONCURRENCY", os.getenv("OLLAMA_NUM_PARALLEL", 4)))
+
+# Web-only research runs currently in progress, by (query, report_type, tone)
+# (per worker process: duplicates handled by another worker are not coalesced)
+_inflight: Dict[Hashable, asyncio.Task] = {}
+
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+def find_old_sessions(cutoff: float) -> List[str]:
+    """List session directories last modified before cutoff (epoch seconds)"""
+    with os.scandir(SESSION_FILES_DIR) as entries:
+        return [
+            entry.path for entry in entries
+            if entry.is_dir(follow_symlinks=False) and entry.stat(follow_symlinks=False).st_mtime < cutoff
+        ]
+
+
+def remove_session_dir(path: str) -> None:
+    try:
+        shutil.rmtree(path)
+        print(f"Cleaned up old session: {os.path.basename(path)}")
+    except Exception as e:
+        print(f"Error cleaning up session {os.path.basename(path)}: {e}")
+
 
 async def cleanup_old_sessions():
     """Remove session directories older than SESSION_MAX_AGE_HOURS"""
     if not SESSION_FILES_DIR.exists():
         return
 
-    cutoff_time = datetime.now() - timedelta(hours=SESSION_MAX_AGE_HOURS)
+    cutoff = time.time() - SESSION_MAX_AGE_HOURS * 3600
 
-    for session_dir in SESSION_FILES_DIR.iterdir():
-        if session_dir.is_dir():
-            # Check directory modification time
-            dir_mtime = datetime.fromtimestamp(session_dir.stat().st_mtime)
-            if dir_mtime < cutoff_time:
-                try:
-                    shutil.rmtree(session_dir)
-                    print(f"Cleaned up old session: {session_dir.name}")
-                except Exception as e:
-                    print(f"Error cleaning up session {session_dir.name}: {e}")
+    # Scan and delete in worker threads (deletions in parallel) so the
+    # event loop keeps serving requests
+    old_sessions = await asyncio.to_thread(find_old_sessions, cutoff)
+    await asyncio.gather(*(asyncio.to_thread(remove_session_dir, path) for path in old_sessions))
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: cleanup old sessions
     await cleanup_old_sessions()
+    app.state.research_semaphore = asyncio.Semaphore(RESEARCH_CONCURRENCY)
     yield
     # Shutdown: nothing to do
 
@@ -50,9 +78,13 @@ app = FastAPI(
     title="GPT Researcher Wrapper",
     description="FastAPI wrapper for GPT Researcher with file upload support",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+# Reports are large text; compress them (clients without br get gzip)
+app.add_middleware(BrotliMiddleware, quality=4, minimum_size=2048)
+
 
 @app.get("/")
 async def root():
@@ -64,6 +96,76 @@ async def root():
     }
 
 
+def copy_spooled_file(src_fd: int, dest_path: Path) -> None:
+    """Copy a file descriptor's contents to dest_path in-kernel with sendfile"""
+    size = os.fstat(src_fd).st_size
+    with open(dest_path, "wb") as out:
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(out.fileno(), src_fd, offset, min(size - offset, 1 << 30))
+            if sent == 0:
+                break
+            offset += sent
+
+
+async def save_upload(file: UploadFile, session_dir: Path) -> Optional[str]:
+    """Stream one uploaded file into the session directory, return its path"""
+    if not file.filename:
+        return None
+
+    file_path = session_dir / file.filename
+
+    # Large uploads are already spooled to a temp file on disk: copy it
+    # without passing the bytes through Python
+    if hasattr(os, "sendfile") and getattr(file.file, "_rolled", False):
+        await asyncio.to_thread(copy_spooled_file, file.file.fileno(), file_path)
+        return str(file_path)
+
+    async with aiofiles.open(file_path, "wb") as f:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await f.write(chunk)
+    return str(file_path)
+
+
+async def single_flight(key: Hashable, make: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run make() once per key at a time: identical requests arriving while the
+    first is still running await its result instead of researching again
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(make())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # shield: one caller disconnecting must not cancel the shared run
+    return await asyncio.shield(task)
+
+
+async def run_research(query: str, report_type: str, tone: str, doc_path: Optional[Path]) -> str:
+    """Research a query and return the report (doc_path: uploaded documents, if any)"""
+    # Initialize GPT Researcher (uploaded files are used alongside web sources)
+    researcher = GPTResearcher(
+        query=query,
+        report_type=report_type,
+        tone=tone,
+        report_source="hybrid" if doc_path else "web"
+    )
+
+    # Point this researcher (not the whole process) at the session files,
+    # so concurrent requests can't pick up each other's documents
+    if doc_path:
+        researcher.cfg.doc_path = str(doc_path)
+
+    # Requests beyond RESEARCH_CONCURRENCY wait here instead of
+    # piling more work onto the LLM
+    async with app.state.research_semaphore:
+        # Conduct research
+        await researcher.conduct_research()
+
+        # Generate report
+        return await researcher.write_report()
+
+
 @app.post("/research")
 async def research(
     background_tasks: BackgroundTasks,
@@ -91,37 +193,26 @@ async def research(
         session_dir = SESSION_FILES_DIR / session_id
         session_dir.mkdir(exist_ok=True)
 
-        # Save uploaded files if any
+        # Save uploaded files if any (concurrently, without blocking the loop)
         uploaded_files = []
         if files:
-            for file in files:
-                if file.filename:
-                    file_path = session_dir / file.filename
-                    with open(file_path, "wb") as f:
-                        content = await file.read()
-                        f.write(content)
-                    uploaded_files.append(str(file_path))
-
-        # Set the local file path for gpt-researcher
-        os.environ["DOC_PATH"] = str(session_dir)
-
-        # Initialize GPT Researcher
-        researcher = GPTResearcher(
-            query=query,
-            report_type=report_type,
-            tone=tone
-        )
-
-        # Conduct research
-        await researcher.conduct_research()
-
-        # Generate report
-        report = await researcher.write_report()
+            saved = await asyncio.gather(*(save_upload(file, session_dir) for file in files))
+            uploaded_files = [path for path in saved if path]
+
+        if uploaded_files:
+            report = await run_research(query, report_type, tone, session_dir)
+        else:
+            # Web-only research doesn't depend on the session, so identical
+            # concurrent requests share one run
+            report = await single_flight(
+                (query, report_type, tone),
+                lambda: run_research(query, report_type, tone, None)
+            )
 
         # Schedule cleanup of this session in background
         background_tasks.add_task(schedule_session_cleanup, session_id)
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -153,7 +244,6 @@ async def schedule_session_cleanup(session_id: str, delay_hours: int = 1):
         session_id: Session ID to clean up
         delay_hours: Hours to wait before cleanup (default: 1 hour)
     """
-    import asyncio
     await asyncio.sleep(delay_hours * 3600)
 
     session_dir = SESSION_FILES_DIR / session_id
@@ -196,9 +286,13 @@ async def delete_session(session_id: str):
 
 
 if __name__ == "__main__":
+    workers = int(os.getenv("WORKERS", 1))
     uvicorn.run(
-        "main:app",
+        app if workers == 1 else "main:app",
         host="0.0.0.0",
         port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
         reload=False
     )
@@ -1,32 +1,68 @@
-import requests
+import asyncio
+import os
+
+import aiofiles
+import httpx
+
+# Max research sessions in flight at once for run_batch (client side)
+MAX_CONCURRENT_SESSIONS = int(os.getenv("CLIENT_CONCURRENCY", 4))
+
 
 # Simple research without files
-def research(session_id, query, base_url="http://localhost:8000"):
-    response = requests.post(
+async def research(client, session_id, query, base_url="http://localhost:8000"):
+    response = await client.post(
         f"{base_url}/research",
         data={"session_id": session_id, "query": query}
     )
     return response.json()
 
+
+async def read_file(path):
+    async with aiofiles.open(path, "rb") as f:
+        return os.path.basename(path), await f.read()
+
+
 # Research with files
-def research_with_files(session_id, query, file_paths, base_url="http://localhost:8000"):
-    files = [("files", open(f, "rb")) for f in file_paths]
-    response = requests.post(
+async def research_with_files(client, session_id, query, file_paths, base_url="http://localhost:8000"):
+    contents = await asyncio.gather(*(read_file(p) for p in file_paths))
+    files = [("files", (name, data)) for name, data in contents]
+    response = await client.post(
         f"{base_url}/research",
         data={"session_id": session_id, "query": query},
-        files=files
+        files=files or None
     )
-    for _, f in files:
-        f.close()
     return response.json()
 
 
+# Run many (session_id, query, file_paths) sessions concurrently
+async def run_batch(sessions, base_url="http://localhost:8000", max_concurrency=MAX_CONCURRENT_SESSIONS):
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async with httpx.AsyncClient(timeout=None) as client:
+        async def run(session_id, query, file_paths):
+            async with semaphore:
+                return await research_with_files(client, session_id, query, file_paths, base_url)
+
+        return await asyncio.gather(*(run(*session) for session in sessions))
+
+
+async def main():
+    async with httpx.AsyncClient(timeout=None) as client:
+        # # Simple research
+        # result = await research(client, "session-001", "What are the latest AI trends?")
+        # print(result["report"])
+
+        # With files (uncomment to use)
+        result = await research_with_files(client, "session-002", "Analyze given file name of 'llms.txt'", ["llms.txt"])
+        print(result["report"])
+
+    # # Several sessions at once
+    # results = await run_batch([
+    #     ("session-003", "What are the latest AI trends?", []),
+    #     ("session-004", "Analyze given file name of 'llms.txt'", ["llms.txt"]),
+    # ])
+
+
 # Example usage
 if __name__ == "__main__":
-    # # Simple research
-    # result = research("session-001", "What are the latest AI trends?")
-    # print(result["report"])
-
-    # With files (uncomment to use)
-    result = research_with_files("session-002", "Analyze given file name of 'llms.txt'", ["llms.txt"])
-    print(result["report"])
+    asyncio.run(main())
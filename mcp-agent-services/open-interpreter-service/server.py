@@ -6,16 +6,19 @@ with configurable permissions and local LLM support.
 """
 
 import os
+import asyncio
 import yaml
-from typing import Optional, Dict, Any
-from fastapi import FastAPI, HTTPException
+import orjson
+from typing import Optional, Dict, Any, List
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-from interpreter import interpreter
+from interpreter import OpenInterpreter
 from dotenv import load_dotenv
 
 load_dotenv()
 
-app = FastAPI(title="Open Interpreter MCP Service")
+app = FastAPI(title="Open Interpreter MCP Service", default_response_class=ORJSONResponse)
 
 # Load configuration
 def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
@@ -29,8 +32,7 @@ config = load_config()
 
 # Configure Open Interpreter with new API
 permissions = config.get('permissions', {})
-interpreter.auto_run = permissions.get('auto_run', False)
-interpreter.offline = True  # Use local models
+auto_run = permissions.get('auto_run', False)
 
 # Local LLM configuration
 llm_config = config.get('llm', {})
@@ -38,17 +40,99 @@ model_name = llm_config.get('model', 'ollama/qwen2.5:7b')
 api_base = llm_config.get('api_base', 'http://host.docker.internal:11434')
 temperature = llm_config.get('temperature', 0.1)
 
-# Set model configuration
-interpreter.model = model_name
-interpreter.api_base = api_base
-interpreter.temperature = temperature
-
 # Set system message
 system_message = config.get('system_message',
     'You are a helpful AI assistant with access to Python code execution. '
     'Be careful and explain what code you will run before executing.'
 )
-interpreter.system_message = system_message
+
+# Number of interpreters serving requests in parallel (match OLLAMA_NUM_PARALLEL)
+INTERPRETER_WORKERS = int(os.getenv("INTERPRETER_WORKERS", 4))
+
+
+def create_interpreter() -> OpenInterpreter:
+    """Create an interpreter with the service configuration."""
+    worker = OpenInterpreter()
+    worker.auto_run = auto_run
+    worker.offline = True  # Use local models
+    worker.model = model_name
+    worker.api_base = api_base
+    worker.temperature = temperature
+    worker.system_message = system_message
+    return worker
+
+
+# Each interpreter has its own state (messages, auto_run); a request checks
+# one out of the pool, so concurrent requests never share an instance
+interpreters: List[OpenInterpreter] = [create_interpreter() for _ in range(INTERPRETER_WORKERS)]
+interpreter_pool: "asyncio.Queue[OpenInterpreter]" = asyncio.Queue()
+for worker in interpreters:
+    interpreter_pool.put_nowait(worker)
+
+
+def prepare_interpreter(worker: OpenInterpreter, run: Optional[bool]) -> None:
+    """Every request starts a fresh conversation on whichever worker it gets."""
+    worker.messages = []
+    worker.auto_run = auto_run if run is None else run
+
+
+def run_interpreter(
+    worker: OpenInterpreter,
+    full_input: str,
+    run: Optional[bool],
+    loop: asyncio.AbstractEventLoop
+) -> list:
+    """
+    Run one command on a checked-out interpreter (blocking, call in a thread).
+    The worker goes back to the pool only once chat() has returned, even if
+    the awaiting request was cancelled meanwhile.
+    """
+    try:
+        prepare_interpreter(worker, run)
+        return worker.chat(full_input, return_messages=True)
+    finally:
+        loop.call_soon_threadsafe(interpreter_pool.put_nowait, worker)
+
+
+_STREAM_DONE = object()
+
+
+def stream_interpreter(
+    worker: OpenInterpreter,
+    full_input: str,
+    run: Optional[bool],
+    loop: asyncio.AbstractEventLoop,
+    queue: asyncio.Queue
+) -> None:
+    """
+    Run a streaming chat (blocking, call in a thread), forwarding each chunk
+    to queue on the event loop. The worker goes back to the pool when done.
+    """
+    try:
+        prepare_interpreter(worker, run)
+        for chunk in worker.chat(full_input, stream=True, display=False):
+            loop.call_soon_threadsafe(queue.put_nowait, chunk)
+    except Exception as e:
+        loop.call_soon_threadsafe(queue.put_nowait, {"type": "error", "content": str(e)})
+    finally:
+        loop.call_soon_threadsafe(queue.put_nowait, _STREAM_DONE)
+        loop.call_soon_threadsafe(interpreter_pool.put_nowait, worker)
+
+
+async def stream_chunks(full_input: str, run: Optional[bool]):
+    """Yield interpreter chunks as NDJSON lines while the command runs."""
+    worker = await interpreter_pool.get()
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    # Keep a reference so the thread task isn't garbage collected; it also
+    # runs to completion if the client disconnects early
+    task = asyncio.create_task(asyncio.to_thread(
+        stream_interpreter, worker, full_input, run, loop, queue
+    ))
+    
+    while (chunk := await queue.get()) is not _STREAM_DONE:
+        yield orjson.dumps(chunk, default=str) + b"\n"
+    await task
 
 
 class InterpretRequest(BaseModel):
@@ -56,6 +140,7 @@ class InterpretRequest(BaseModel):
     command: str
     context: Optional[str] = None
     auto_run: Optional[bool] = None
+    stream: bool = False
 
 
 class InterpretResponse(BaseModel):
@@ -72,8 +157,10 @@ async def health():
     return {
         "status": "healthy",
         "service": "open-interpreter",
-        "model": interpreter.model,
-        "auto_run": interpreter.auto_run
+        "model": model_name,
+        "auto_run": auto_run,
+        "workers": INTERPRETER_WORKERS,
+        "idle_workers": interpreter_pool.qsize()
     }
 
 
@@ -86,6 +173,7 @@ async def interpret_command(request: InterpretRequest):
         command: Natural language command to interpret
         context: Optional context for the command
         auto_run: Override auto_run setting for this request
+        stream: Stream chunks as NDJSON while the command runs
     """
     try:
         # Prepare input
@@ -93,16 +181,18 @@ async def interpret_command(request: InterpretRequest):
         if request.context:
             full_input = f"Context: {request.context}\n\nTask: {request.command}"
         
-        # Override auto_run if specified
-        original_auto_run = interpreter.auto_run
-        if request.auto_run is not None:
-            interpreter.auto_run = request.auto_run
+        if request.stream:
+            return StreamingResponse(
+                stream_chunks(full_input, request.auto_run),
+                media_type="application/x-ndjson"
+            )
         
-        # Execute
-        result = interpreter.chat(full_input, return_messages=True)
-        
-        # Restore original setting
-        interpreter.auto_run = original_auto_run
+        # Execute on a free interpreter; chat() blocks, so run it in a thread
+        worker = await interpreter_pool.get()
+        result = await asyncio.to_thread(
+            run_interpreter, worker, full_input, request.auto_run,
+            asyncio.get_running_loop()
+        )
         
         # Extract output and code
         output_parts = []
@@ -130,27 +220,40 @@ async def interpret_command(request: InterpretRequest):
 
 @app.post("/reset")
 async def reset_interpreter():
-    """Reset interpreter conversation history."""
-    try:
-        interpreter.messages = []
-        return {"status": "reset", "message": "Conversation history cleared"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    """
+    Kept for compatibility; no-op.
+    
+    Every /interpret request already starts from an empty conversation, and
+    clearing an interpreter that is mid-chat would truncate that request's result.
+    """
+    return {"status": "reset", "message": "No history to clear: each request runs as a fresh conversation"}
 
 
 @app.get("/config")
 async def get_config():
     """Get current configuration."""
     return {
-        "model": interpreter.model,
-        "api_base": interpreter.api_base,
-        "temperature": interpreter.temperature,
-        "auto_run": interpreter.auto_run,
-        "offline": interpreter.offline
+        "model": model_name,
+        "api_base": api_base,
+        "temperature": temperature,
+        "auto_run": auto_run,
+        "offline": True,
+        "workers": INTERPRETER_WORKERS
     }
 
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("SERVICE_PORT", 8001))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Each worker process holds its own interpreter pool
+    workers = int(os.getenv("WORKERS", 1))
+    # A single worker serves this already-imported app; an import string
+    # (needed for workers > 1) would import the module a second time
+    uvicorn.run(
+        app if workers == 1 else "server:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=workers
+    )